@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Conversation Session - Stages conversation rows in memory until the session ends.
+
+Rows the scanner and fixer record go to an in-memory database shared by every session
+in the process on the same on-disk database, so a fixer run after a scanner reads the
+scan without a round trip through disk. They are written to disk in one transaction
+when the session is flushed, and at the latest when the process exits.
+"""
+
+import atexit
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _session_uri(db_path: Path) -> str:
+    """URI of the in-memory database conversation rows for db_path are staged in.
+
+    It is shared by every connection in this process that targets the same database,
+    and by no other, so sessions on different databases never flush each other's rows.
+    """
+    key = hashlib.blake2b(str(Path(db_path).resolve()).encode(), digest_size=16).hexdigest()
+    return f"file:codex_session_{key}?mode=memory&cache=shared"
+
+
+_CONVERSATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {schema}.codex_conversations (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT,
+        observation_type TEXT,
+        narrative TEXT,
+        metadata TEXT
+    )
+"""
+
+
+class ConversationSession:
+    """Conversation rows for one on-disk database, staged in memory until flushed."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Session database connection, with the on-disk database attached as disk."""
+        if self._conn is None:
+            conn = sqlite3.connect(_session_uri(self.db_path), uri=True)
+            conn.execute("ATTACH DATABASE ? AS disk", (str(self.db_path),))
+            conn.execute("PRAGMA disk.journal_mode=WAL")
+            conn.execute("PRAGMA disk.synchronous=NORMAL")
+            conn.execute(_CONVERSATIONS_TABLE.format(schema="main"))
+            self._conn = conn
+            # Rows still staged when the process ends are written out rather than lost
+            atexit.register(self.flush)
+        return self._conn
+
+    def stage(self, rows: list[tuple[str, str, str, str]]) -> None:
+        """Stage (timestamp, observation_type, narrative, metadata) rows for the next flush."""
+        conn = self._connection()
+        conn.execute("BEGIN")
+        conn.executemany(
+            """
+            INSERT INTO main.codex_conversations (timestamp, observation_type, narrative, metadata)
+            VALUES (?, ?, ?, ?)
+        """,
+            rows,
+        )
+        conn.execute("COMMIT")
+
+    def latest_metadata(self, observation_type: str) -> str | None:
+        """Metadata of the newest observation_type row, or None if there is none."""
+        # Rows staged in this session are newer than anything already on disk
+        conn = self._connection()
+        for schema in ("main", "disk"):
+            row = conn.execute(
+                f"""
+                SELECT metadata FROM {schema}.codex_conversations
+                WHERE observation_type = ?
+                ORDER BY timestamp DESC LIMIT 1
+            """,
+                (observation_type,),
+            ).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    def flush(self) -> None:
+        """Write the staged conversation rows to the on-disk database in one transaction."""
+        conn = self._connection()
+        if not conn.execute("SELECT 1 FROM main.codex_conversations LIMIT 1").fetchone():
+            return
+
+        # Create conversation table if it doesn't exist
+        conn.execute(_CONVERSATIONS_TABLE.format(schema="disk"))
+        # Lets the "latest self_scan" lookup seek the index instead of scanning the table
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS disk.idx_cc_type_ts
+            ON codex_conversations(observation_type, timestamp DESC)
+        """)
+
+        conn.execute("BEGIN")
+        conn.execute("""
+            INSERT INTO disk.codex_conversations (timestamp, observation_type, narrative, metadata)
+            SELECT timestamp, observation_type, narrative, metadata FROM main.codex_conversations ORDER BY id
+        """)
+        conn.execute("DELETE FROM main.codex_conversations")
+        conn.execute("COMMIT")
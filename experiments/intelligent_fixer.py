@@ -7,10 +7,90 @@ decisions about WHAT to fix and HOW to fix it. No blind automation - every fix
 is intelligently considered.
 """
 
+import os
 import re
+import sys
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
+# Interned tags so the per-issue equality checks hit the identity fast path
+_VERDICT_REAL_VIOLATION = sys.intern("real_violation")
+
+_ACTION_PRINT_TO_LOGGING = sys.intern("convert_print_to_logging")
+_ACTION_REPLACE_PATH = sys.intern("replace_hardcoded_path")
+_ACTION_NO_FIX_RECOMMENDED = sys.intern("no_fix_recommended")
+_ACTION_NO_FIX_NEEDED = sys.intern("no_fix_needed")
+
+_FILE_TYPE_TEST = sys.intern("test")
+_FILE_TYPE_CLI = sys.intern("cli")
+_FILE_TYPE_CONFIG = sys.intern("config")
+_FILE_TYPE_SCRIPT = sys.intern("script")
+_FILE_TYPE_LIBRARY = sys.intern("library")
+
+# How much of a file header the file-type classifier looks at
+_CLASSIFY_HEADER_SIZE = 2048
+
+
+def _header_end(data: bytes, line_count: int) -> int:
+    """Return the byte offset just past the first ``line_count`` lines of ``data``."""
+    pos = 0
+    for _ in range(line_count):
+        pos = data.find(b"\n", pos)
+        if pos == -1:
+            return len(data)
+        pos += 1
+    return pos
+
+
+def _header_slice(data: bytes, line_count: int) -> bytes:
+    """Return the first ``line_count`` lines of ``data``."""
+    return data[: _header_end(data, line_count)]
+
+
+def _classify_file_type(file_path: Path, header: bytes) -> str:
+    """Intelligently classify what type of file this is, from its path and first bytes."""
+    path_str = str(file_path).lower()
+    if "test" in path_str:
+        return _FILE_TYPE_TEST
+
+    content = header.decode("utf-8", errors="ignore").lower()
+
+    if "test" in content:
+        return _FILE_TYPE_TEST
+    elif "cli" in path_str or "__main__" in content:
+        return _FILE_TYPE_CLI
+    elif "config" in path_str or "settings" in path_str:
+        return _FILE_TYPE_CONFIG
+    elif "main" in path_str or "if __name__" in content:
+        return _FILE_TYPE_SCRIPT
+    else:
+        return _FILE_TYPE_LIBRARY
+
+
+class Impact(IntEnum):
+    """Impact of leaving an issue unfixed."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    UNKNOWN = 3
+
+
+class Risk(IntEnum):
+    """Risk of applying a fix."""
+
+    LOW = 0
+    MEDIUM = 1
+
+
+class Necessity(IntEnum):
+    """How much an issue needs fixing."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
 
 class IntelligentFixer:
     """
@@ -27,6 +107,8 @@ class IntelligentFixer:
         self.target_dir = target_dir
         self.fix_decisions = []
         self.fixes_applied = []
+        # file_path -> ((mtime_ns, size), file_info)
+        self._file_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
     def analyze_and_fix_intelligently(self, issues: list[dict[str, Any]]) -> dict[str, Any]:
         """
@@ -60,27 +142,29 @@ class IntelligentFixer:
         candidate = issue["candidate"]
         verdict = issue["intelligent_verdict"]
 
-        # Get full context for intelligent analysis
         file_path = Path(candidate.file_path)
-        full_context = self._get_full_file_context(file_path, candidate.line_number)
 
         fix_plan = {
             "issue": issue,
             "file_path": file_path,
             "line_number": candidate.line_number,
-            "intelligent_analysis": self._perform_intelligent_analysis(candidate, full_context),
+            "intelligent_analysis": None,
             "fix_strategy": None,
             "fix_approved": False,
             "fix_complexity": "unknown",
         }
 
-        # Intelligent fix strategy based on analysis
-        if verdict == "real_violation":
+        # Intelligent fix strategy based on analysis; other verdicts are never fixed,
+        # so reading the file and analyzing it would only be thrown away
+        if verdict == _VERDICT_REAL_VIOLATION:
+            # Get full context for intelligent analysis
+            full_context = self._get_full_file_context(file_path, candidate.line_number)
+            fix_plan["intelligent_analysis"] = self._perform_intelligent_analysis(candidate, full_context)
             fix_plan["fix_strategy"] = self._design_intelligent_fix_strategy(candidate, full_context)
             fix_plan["fix_approved"] = self._should_auto_approve_fix(fix_plan)
             fix_plan["fix_complexity"] = self._assess_fix_complexity(fix_plan)
         else:
-            fix_plan["fix_strategy"] = {"action": "no_fix_needed", "reason": f"Verdict: {verdict}"}
+            fix_plan["fix_strategy"] = {"action": _ACTION_NO_FIX_NEEDED, "reason": f"Verdict: {verdict}"}
             fix_plan["fix_approved"] = True  # Approved to NOT fix
             fix_plan["fix_complexity"] = "none"
 
@@ -89,43 +173,74 @@ class IntelligentFixer:
     def _get_full_file_context(self, file_path: Path, line_number: int) -> dict[str, Any]:
         """Get full file context for intelligent analysis."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
-
-            return {
-                "total_lines": len(lines),
-                "target_line": lines[line_number - 1].strip() if line_number <= len(lines) else "",
-                "surrounding_lines": lines[max(0, line_number - 6) : line_number + 5],
-                "file_imports": [line.strip() for line in lines[:20] if line.strip().startswith(("import ", "from "))],
-                "file_type": self._classify_file_type(file_path, lines),
-                "has_logging": any("logging" in line for line in lines[:30]),
-            }
+            file_info = self._load_file_once(file_path)
         except (OSError, UnicodeDecodeError):
             return {"error": "Could not read file"}
 
-    def _classify_file_type(self, file_path: Path, lines: list[str]) -> str:
-        """Intelligently classify what type of file this is."""
-        path_str = str(file_path).lower()
-        content = "".join(lines[:50]).lower()  # First 50 lines
-
-        if "test" in path_str or "test" in content:
-            return "test"
-        elif "cli" in path_str or "__main__" in content:
-            return "cli"
-        elif "config" in path_str or "settings" in path_str:
-            return "config"
-        elif "main" in path_str or "if __name__" in content:
-            return "script"
-        else:
-            return "library"
+        lines = file_info["lines"]
+        return {
+            "total_lines": len(lines),
+            "target_line": lines[line_number - 1].strip() if line_number <= len(lines) else "",
+            "surrounding_lines": lines[max(0, line_number - 6) : line_number + 5],
+            "file_imports": file_info["file_imports"],
+            "file_type": file_info["file_type"],
+            "has_logging": file_info["has_logging"],
+        }
+
+    def _load_file_once(self, file_path: Path) -> dict[str, Any]:
+        """Read and analyze a file, reusing the cached result while mtime and size are unchanged."""
+        st = os.stat(file_path)
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        with open(file_path, "rb") as f:
+            data = f.read()
+        has_logging = b"logging" in _header_slice(data, 30)
+
+        # Split on "\n" only, keeping it: splitlines would also break on form feeds and
+        # other separators, throwing line numbers off from the scanners'. The lines stay
+        # byte-exact, as the tail rewrite relies on
+        lines = [line + "\n" for line in data.decode("utf-8").split("\n")]
+        lines[-1] = lines[-1][:-1]
+        if not lines[-1]:
+            lines.pop()
+
+        # Remember where the import block ends so fixes can insert imports without rescanning
+        last_import_idx = 0
+        last_non_logging_import_idx = 0
+        for i, line in enumerate(lines):
+            if line.strip().startswith(("import ", "from ")):
+                last_import_idx = i
+                if "logging" not in line:
+                    last_non_logging_import_idx = i
+
+        file_info = {
+            "lines": lines,
+            "last_import_idx": last_import_idx,
+            "last_non_logging_import_idx": last_non_logging_import_idx,
+            "file_imports": [line.strip() for line in lines[:20] if line.strip().startswith(("import ", "from "))],
+            "file_type": _classify_file_type(file_path, data[:_CLASSIFY_HEADER_SIZE]),
+            "has_logging": has_logging,
+        }
+        self._file_cache[file_path] = (fingerprint, file_info)
+        return file_info
 
     def _perform_intelligent_analysis(self, candidate, context: dict[str, Any]) -> dict[str, Any]:
         """Perform deep intelligent analysis of the issue."""
+        impact, impact_label = self._assess_impact(candidate, context)
+        risk, risk_label = self._assess_risk_level(candidate, context)
+        necessity, necessity_label = self._assess_fix_necessity(candidate, context, impact, risk)
+
         analysis = {
             "context_understanding": self._understand_context(candidate, context),
-            "impact_assessment": self._assess_impact(candidate, context),
-            "risk_level": self._assess_risk_level(candidate, context),
-            "fix_necessity": self._assess_fix_necessity(candidate, context),
+            "impact": impact,
+            "impact_assessment": impact_label,
+            "risk": risk,
+            "risk_level": risk_label,
+            "necessity": necessity,
+            "fix_necessity": necessity_label,
         }
 
         return analysis
@@ -136,9 +251,9 @@ class IntelligentFixer:
         target_line = context.get("target_line", "")
 
         if "print(" in target_line:
-            if file_type == "cli":
+            if file_type == _FILE_TYPE_CLI:
                 return "Print statement in CLI context - likely user output"
-            elif file_type == "test":
+            elif file_type == _FILE_TYPE_TEST:
                 return "Print statement in test context - likely debug output"
             else:
                 return "Print statement in library code - should use logging"
@@ -150,44 +265,44 @@ class IntelligentFixer:
         else:
             return "General code pattern issue"
 
-    def _assess_impact(self, candidate, context: dict[str, Any]) -> str:
+    def _assess_impact(self, candidate, context: dict[str, Any]) -> tuple[Impact, str]:
         """Assess the impact of NOT fixing this issue."""
         pattern_name = candidate.pattern_name
         file_type = context.get("file_type", "unknown")
 
         if "print" in pattern_name:
-            if file_type in ["cli", "script"]:
-                return "Low impact - user-facing output expected"
+            if file_type in (_FILE_TYPE_CLI, _FILE_TYPE_SCRIPT):
+                return Impact.LOW, "Low impact - user-facing output expected"
             else:
-                return "Medium impact - inconsistent logging approach"
+                return Impact.MEDIUM, "Medium impact - inconsistent logging approach"
         elif "path" in pattern_name:
-            return "High impact - portability and configuration issues"
+            return Impact.HIGH, "High impact - portability and configuration issues"
         else:
-            return "Unknown impact - needs case-by-case assessment"
+            return Impact.UNKNOWN, "Unknown impact - needs case-by-case assessment"
 
-    def _assess_risk_level(self, candidate, context: dict[str, Any]) -> str:
+    def _assess_risk_level(self, candidate, context: dict[str, Any]) -> tuple[Risk, str]:
         """Assess the risk of applying the fix."""
-        if context.get("file_type") == "test":
-            return "Low risk - test code changes are safe"
+        if context.get("file_type") == _FILE_TYPE_TEST:
+            return Risk.LOW, "Low risk - test code changes are safe"
         elif "cli" in str(candidate.file_path).lower():
-            return "Medium risk - CLI behavior changes affect users"
+            return Risk.MEDIUM, "Medium risk - CLI behavior changes affect users"
         else:
-            return "Low risk - internal code improvements"
+            return Risk.LOW, "Low risk - internal code improvements"
 
-    def _assess_fix_necessity(self, candidate, context: dict[str, Any]) -> str:
+    def _assess_fix_necessity(
+        self, candidate, context: dict[str, Any], impact: Impact, risk: Risk
+    ) -> tuple[Necessity, str]:
         """Intelligently assess whether this really needs fixing."""
-        impact = self._assess_impact(candidate, context)
-        risk = self._assess_risk_level(candidate, context)
         file_type = context.get("file_type", "unknown")
 
-        if "High impact" in impact and "Low risk" in risk:
-            return "High necessity - clear improvement with low risk"
-        elif file_type == "cli" and "print(" in candidate.code_line:
-            return "Low necessity - CLI output is appropriate"
-        elif "Medium impact" in impact:
-            return "Medium necessity - worthwhile improvement"
+        if impact == Impact.HIGH and risk <= Risk.LOW:
+            return Necessity.HIGH, "High necessity - clear improvement with low risk"
+        elif file_type == _FILE_TYPE_CLI and "print(" in candidate.code_line:
+            return Necessity.LOW, "Low necessity - CLI output is appropriate"
+        elif impact == Impact.MEDIUM:
+            return Necessity.MEDIUM, "Medium necessity - worthwhile improvement"
         else:
-            return "Low necessity - minor improvement"
+            return Necessity.LOW, "Low necessity - minor improvement"
 
     def _design_intelligent_fix_strategy(self, candidate, context: dict[str, Any]) -> dict[str, Any]:
         """Design an intelligent fix strategy based on deep analysis."""
@@ -195,10 +310,10 @@ class IntelligentFixer:
         file_type = context.get("file_type", "unknown")
         has_logging = context.get("has_logging", False)
 
-        if "print(" in target_line and file_type not in ["cli", "script"]:
+        if "print(" in target_line and file_type not in (_FILE_TYPE_CLI, _FILE_TYPE_SCRIPT):
             # Intelligent print statement fixing
             return {
-                "action": "convert_print_to_logging",
+                "action": _ACTION_PRINT_TO_LOGGING,
                 "method": "logging.info()" if not "error" in target_line.lower() else "logging.error()",
                 "needs_import": not has_logging,
                 "preserve_formatting": True,
@@ -207,13 +322,16 @@ class IntelligentFixer:
         elif ".db" in target_line and "settings" not in str(candidate.file_path):
             # Intelligent path fixing
             return {
-                "action": "replace_hardcoded_path",
+                "action": _ACTION_REPLACE_PATH,
                 "replacement": "settings.database_path",
                 "needs_import": "from .settings import settings" not in context.get("file_imports", []),
                 "reason": "Use configuration for better portability",
             }
         else:
-            return {"action": "no_fix_recommended", "reason": "Context analysis suggests this is acceptable as-is"}
+            return {
+                "action": _ACTION_NO_FIX_RECOMMENDED,
+                "reason": "Context analysis suggests this is acceptable as-is",
+            }
 
     def _should_auto_approve_fix(self, fix_plan: dict[str, Any]) -> bool:
         """Intelligently decide if this fix should be auto-approved."""
@@ -225,15 +343,15 @@ class IntelligentFixer:
         # 2. Simple conversion (print to logging)
         # 3. Clear improvement with no ambiguity
 
-        necessity = analysis.get("fix_necessity", "")
-        risk = analysis.get("risk_level", "")
+        necessity = analysis.get("necessity", Necessity.LOW)
+        risk = analysis.get("risk", Risk.MEDIUM)
         action = strategy.get("action", "")
 
-        if "High necessity" in necessity and "Low risk" in risk:
+        if necessity >= Necessity.HIGH and risk <= Risk.LOW:
             return True
-        elif action == "convert_print_to_logging" and "library" in str(fix_plan["file_path"]):
+        elif action == _ACTION_PRINT_TO_LOGGING and "library" in str(fix_plan["file_path"]):
             return True
-        elif action == "no_fix_recommended":
+        elif action == _ACTION_NO_FIX_RECOMMENDED:
             return True
         else:
             return False  # Require manual approval
@@ -243,9 +361,9 @@ class IntelligentFixer:
         strategy = fix_plan["fix_strategy"]
         action = strategy.get("action", "")
 
-        if action == "no_fix_recommended":
+        if action == _ACTION_NO_FIX_RECOMMENDED:
             return "none"
-        elif action == "convert_print_to_logging" and not strategy.get("needs_import"):
+        elif action == _ACTION_PRINT_TO_LOGGING and not strategy.get("needs_import"):
             return "simple"
         elif strategy.get("needs_import"):
             return "medium"
@@ -266,7 +384,7 @@ class IntelligentFixer:
         if auto_approved:
             print("\n✅ Auto-approved fixes:")
             for plan in auto_approved:
-                if plan["fix_strategy"]["action"] != "no_fix_recommended":
+                if plan["fix_strategy"]["action"] != _ACTION_NO_FIX_RECOMMENDED:
                     print(f"  {Path(plan['file_path']).name}:{plan['line_number']} - {plan['fix_strategy']['action']}")
                     print(f"    Reason: {plan['fix_strategy']['reason']}")
 
@@ -279,7 +397,7 @@ class IntelligentFixer:
         approved_fixes = [
             plan
             for plan in fix_plans
-            if plan["fix_approved"] and plan["fix_strategy"]["action"] != "no_fix_recommended"
+            if plan["fix_approved"] and plan["fix_strategy"]["action"] != _ACTION_NO_FIX_RECOMMENDED
         ]
 
         print(f"\nTotal approved fixes: {len(approved_fixes)}")
@@ -294,7 +412,7 @@ class IntelligentFixer:
             "fixes_attempted": len(approved_fixes),
             "fixes_successful": 0,
             "fixes_failed": 0,
-            "files_modified": set(),
+            "files_modified": {},  # dict keeps insertion order while deduplicating
             "fix_details": [],
         }
 
@@ -303,7 +421,7 @@ class IntelligentFixer:
                 success = self._apply_single_fix(fix_plan)
                 if success:
                     results["fixes_successful"] += 1
-                    results["files_modified"].add(str(fix_plan["file_path"]))
+                    results["files_modified"][str(fix_plan["file_path"])] = None
                     results["fix_details"].append(
                         {
                             "file": str(fix_plan["file_path"]),
@@ -333,22 +451,23 @@ class IntelligentFixer:
         strategy = fix_plan["fix_strategy"]
 
         try:
-            # Read file
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
+            # Read file (copy the cached lines, they are mutated below)
+            file_info = self._load_file_once(Path(file_path))
+            original_lines = file_info["lines"]
+            lines = list(original_lines)
 
             # Apply the fix
-            if strategy["action"] == "convert_print_to_logging":
-                success = self._apply_print_fix(lines, line_number, strategy)
-            elif strategy["action"] == "replace_hardcoded_path":
-                success = self._apply_path_fix(lines, line_number, strategy)
+            if strategy["action"] == _ACTION_PRINT_TO_LOGGING:
+                success = self._apply_print_fix(lines, line_number, strategy, file_info["last_non_logging_import_idx"])
+            elif strategy["action"] == _ACTION_REPLACE_PATH:
+                success = self._apply_path_fix(lines, line_number, strategy, file_info["last_import_idx"])
             else:
                 return False
 
             if success:
-                # Write file back
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.writelines(lines)
+                # Write back only the part of the file from the first changed line onwards
+                self._rewrite_changed_tail(file_path, original_lines, lines)
+                self._file_cache.pop(Path(file_path), None)
 
                 print(f"✅ Fixed {Path(file_path).name}:{line_number} - {strategy['action']}")
                 return True
@@ -358,7 +477,20 @@ class IntelligentFixer:
 
         return False
 
-    def _apply_print_fix(self, lines: list[str], line_number: int, strategy: dict[str, Any]) -> bool:
+    def _rewrite_changed_tail(self, file_path: Path, original_lines: list[str], lines: list[str]) -> None:
+        """Rewrite ``file_path`` in place starting at the first line that differs from ``original_lines``."""
+        first_changed = next(
+            (i for i, (old, new) in enumerate(zip(original_lines, lines, strict=False)) if old != new),
+            min(len(original_lines), len(lines)),
+        )
+
+        offset = len("".join(original_lines[:first_changed]).encode("utf-8"))
+        with open(file_path, "r+b") as f:
+            f.seek(offset)
+            f.write("".join(lines[first_changed:]).encode("utf-8"))
+            f.truncate()
+
+    def _apply_print_fix(self, lines: list[str], line_number: int, strategy: dict[str, Any], import_line: int) -> bool:
         """Apply print statement fix using Codex for text manipulation."""
         if line_number > len(lines):
             return False
@@ -373,18 +505,13 @@ class IntelligentFixer:
 
             # Add import if needed
             if strategy.get("needs_import"):
-                # Find good spot for import
-                import_line = 0
-                for i, line in enumerate(lines):
-                    if line.strip().startswith(("import ", "from ")) and "logging" not in line:
-                        import_line = i
                 lines.insert(import_line + 1, "import logging\n")
 
             return True
 
         return False
 
-    def _apply_path_fix(self, lines: list[str], line_number: int, strategy: dict[str, Any]) -> bool:
+    def _apply_path_fix(self, lines: list[str], line_number: int, strategy: dict[str, Any], import_line: int) -> bool:
         """Apply hardcoded path fix using Codex for text manipulation."""
         if line_number > len(lines):
             return False
@@ -400,10 +527,6 @@ class IntelligentFixer:
 
             # Add import if needed
             if strategy.get("needs_import"):
-                import_line = 0
-                for i, line in enumerate(lines):
-                    if line.strip().startswith(("import ", "from ")):
-                        import_line = i
                 lines.insert(import_line + 1, "from .settings import settings\n")
 
             return True
@@ -413,8 +536,6 @@ class IntelligentFixer:
 
 def main():
     """Demonstrate intelligent fixing with Codex-Claude collaboration."""
-    import os
-
     from intelligent_scanner import IntelligentScanner
 
     def get_xdg_path(xdg_var: str, default_suffix: str) -> Path:
@@ -7,11 +7,35 @@ rather than automatic violation reporting. Claude (the AI) makes the actual deci
 about what constitutes real issues and how to fix them.
 """
 
+import os
+import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from fixer_utils import iter_py_files
+
+# Substring checks of the candidate analyses, each one search over the lowered code line
+_PRINT_FALSE_POSITIVE = re.compile(r"#|\"\"\"|'''")
+_QUOTED_DB = re.compile(r"\.db[\"']")
+_CORS_CONTEXT = re.compile(r"cors|origin|access-control")
+_LEGITIMATE_WILDCARD = re.compile(r"glob|\*args|\*\*kwargs|import")
+_QUOTED_WILDCARD = re.compile(r"\"\*\"|'\*'")
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a pattern case-insensitively, once; an invalid regex matches literally."""
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return re.compile(re.escape(pattern), re.IGNORECASE)
+
 
 @dataclass
 class ScanCandidate:
@@ -37,12 +61,51 @@ class IntelligentScanner:
     - Interactive decision-making for ambiguous cases
     """
 
+    # Existing refined patterns, used as suggestion generators
+    suggestion_patterns = {
+        "potential_print_issue": {
+            "triggers": [r"print\s*\(", r"console\.print\s*\("],
+            "excludes": [r"#.*print", r'""".*print.*"""'],
+            "confidence": 0.8,
+        },
+        "potential_hardcoded_path": {
+            "triggers": [r'["\'][^"\']*\.db["\']', r'["\']~/.+["\']'],
+            "excludes": [r"#.*\.db", r"test.*\.db"],
+            "confidence": 0.7,
+        },
+        "potential_cors_issue": {
+            "triggers": [r'["\']?\*["\']?'],
+            "excludes": [r"import.*\*", r"\.glob\(", r"\*args", r"\*\*kwargs"],
+            "confidence": 0.3,  # Low confidence - needs intelligent review
+        },
+    }
+
     def __init__(self, db_path: Path, codex_dir: Path):
         self.db_path = db_path
         self.codex_dir = codex_dir
         self.candidates = []
         self.decisions = []
 
+        # Compile every trigger and exclude once, instead of once per line scanned
+        self._compiled_patterns = {
+            pattern_name: {
+                "triggers": [(trigger, _compile(trigger)) for trigger in pattern_config.get("triggers", [])],
+                "excludes": [_compile(exclude) for exclude in pattern_config.get("excludes", [])],
+                "confidence": pattern_config.get("confidence", 0.5),
+            }
+            for pattern_name, pattern_config in self.suggestion_patterns.items()
+        }
+
+        # Any trigger at all, so files and lines without one are passed over in one search
+        self._any_trigger = re.compile(
+            "|".join(
+                f"(?:{compiled.pattern})"
+                for pattern_config in self._compiled_patterns.values()
+                for _, compiled in pattern_config["triggers"]
+            ),
+            re.IGNORECASE,
+        )
+
     def fast_pattern_scan(self) -> list[ScanCandidate]:
         """Use Codex patterns for fast initial scanning - these are SUGGESTIONS only."""
         print("=== CODEX FAST PATTERN SCAN ===")
@@ -50,31 +113,9 @@ class IntelligentScanner:
 
         candidates = []
 
-        # Use existing refined patterns as suggestion generators
-        suggestion_patterns = {
-            "potential_print_issue": {
-                "triggers": [r"print\s*\(", r"console\.print\s*\("],
-                "excludes": [r"#.*print", r'""".*print.*"""'],
-                "confidence": 0.8,
-            },
-            "potential_hardcoded_path": {
-                "triggers": [r'["\'][^"\']*\.db["\']', r'["\']~/.+["\']'],
-                "excludes": [r"#.*\.db", r"test.*\.db"],
-                "confidence": 0.7,
-            },
-            "potential_cors_issue": {
-                "triggers": [r'["\']?\*["\']?'],
-                "excludes": [r"import.*\*", r"\.glob\(", r"\*args", r"\*\*kwargs"],
-                "confidence": 0.3,  # Low confidence - needs intelligent review
-            },
-        }
-
         files_scanned = 0
-        for py_file in self.codex_dir.rglob("*.py"):
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv", ".git"]):
-                continue
-
-            file_candidates = self._scan_file_for_candidates(py_file, suggestion_patterns)
+        for py_file in iter_py_files(self.codex_dir, skip_prefixes=()):
+            file_candidates = self._scan_file_for_candidates(py_file, self._compiled_patterns)
             candidates.extend(file_candidates)
             files_scanned += 1
 
@@ -84,41 +125,59 @@ class IntelligentScanner:
         return candidates
 
     def _scan_file_for_candidates(self, file_path: Path, patterns: dict) -> list[ScanCandidate]:
-        """Scan a single file for candidate issues."""
+        """Scan a single file for candidate issues, given the compiled suggestion patterns."""
         candidates = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
+            content = file_path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
             return candidates
 
+        # Only a line matching a trigger can be a candidate, so one search decides most files
+        if not self._any_trigger.search(content):
+            return candidates
+
+        # The lines as readlines would give them, without their newlines
+        lines = content.split("\n")
+        if not lines[-1]:
+            lines.pop()
+
+        file_name = str(file_path)
+        is_test_file = "test" in file_name.lower()
+
         for line_num, line in enumerate(lines, 1):
-            # Get context lines (3 before, 3 after)
-            start_idx = max(0, line_num - 4)
-            end_idx = min(len(lines), line_num + 3)
-            context_lines = [f"{i}: {lines[i-1].rstrip()}" for i in range(start_idx + 1, end_idx + 1)]
+            # Most lines match no trigger at all, and one search over the union rules that out
+            if not self._any_trigger.search(line):
+                continue
+
+            # Context lines (3 before, 3 after) are built only once the line is a candidate
+            context_lines = None
 
             for pattern_name, pattern_config in patterns.items():
                 # Check excludes first
-                if any(self._matches_pattern(line, exclude) for exclude in pattern_config.get("excludes", [])):
+                if any(self._matches_pattern(line, exclude) for exclude in pattern_config["excludes"]):
                     continue
 
                 # Check triggers
-                for trigger in pattern_config.get("triggers", []):
-                    if self._matches_pattern(line, trigger):
+                for trigger, compiled in pattern_config["triggers"]:
+                    if self._matches_pattern(line, compiled):
+                        if context_lines is None:
+                            start_idx = max(0, line_num - 4)
+                            end_idx = min(len(lines), line_num + 3)
+                            context_lines = [f"{i}: {lines[i - 1].rstrip()}" for i in range(start_idx + 1, end_idx + 1)]
+
                         candidates.append(
                             ScanCandidate(
-                                file_path=str(file_path),
+                                file_path=file_name,
                                 line_number=line_num,
                                 pattern_name=pattern_name,
                                 code_line=line.strip(),
                                 context_lines=context_lines,
-                                pattern_confidence=pattern_config.get("confidence", 0.5),
+                                pattern_confidence=pattern_config["confidence"],
                                 metadata={
                                     "trigger": trigger,
                                     "file_size": len(lines),
-                                    "is_test_file": "test" in str(file_path).lower(),
+                                    "is_test_file": is_test_file,
                                 },
                             )
                         )
@@ -126,14 +185,11 @@ class IntelligentScanner:
 
         return candidates
 
-    def _matches_pattern(self, line: str, pattern: str) -> bool:
-        """Check if line matches pattern."""
-        import re
-
-        try:
-            return bool(re.search(pattern, line, re.IGNORECASE))
-        except re.error:
-            return pattern.lower() in line.lower()
+    def _matches_pattern(self, line: str, pattern: re.Pattern | str) -> bool:
+        """Check if line matches pattern, compiled or not."""
+        if isinstance(pattern, str):
+            pattern = _compile(pattern)
+        return bool(pattern.search(line))
 
     def intelligent_review(self, candidates: list[ScanCandidate]) -> list[dict[str, Any]]:
         """
@@ -191,14 +247,14 @@ class IntelligentScanner:
         code = candidate.code_line.lower()
 
         # Intelligence: Real print statements vs false positives
-        if "print(" in code and not any(fp in code for fp in ["#", '"""', "'''"]):
+        if "print(" in code and not _PRINT_FALSE_POSITIVE.search(code):
             # Look at context for intelligence
             context_text = " ".join(candidate.context_lines).lower()
 
             if "test" in context_text or "debug" in context_text:
                 verdict = "acceptable_debug"
                 confidence = 0.8
-            elif "cli" in candidate.file_path.lower() or "main" in candidate.file_path.lower():
+            elif "cli" in (file_path := candidate.file_path.lower()) or "main" in file_path:
                 verdict = "acceptable_cli_output"
                 confidence = 0.7
             else:
@@ -221,7 +277,7 @@ class IntelligentScanner:
         code = candidate.code_line.lower()
 
         # Intelligence: Real hardcoded paths vs configuration
-        if '.db"' in code or ".db'" in code:
+        if _QUOTED_DB.search(code):
             if "test" in code or "example" in code:
                 verdict = "acceptable_test_path"
                 confidence = 0.8
@@ -245,13 +301,13 @@ class IntelligentScanner:
         code = candidate.code_line.lower()
 
         # Intelligence: CORS security issues vs legitimate wildcards
-        if "cors" in code or "origin" in code or "access-control" in code:
+        if _CORS_CONTEXT.search(code):
             verdict = "potential_security_issue"
             confidence = 0.9
-        elif any(legit in code for legit in ["glob", "rglob", "*args", "**kwargs", "import"]):
+        elif _LEGITIMATE_WILDCARD.search(code):
             verdict = "legitimate_wildcard"
             confidence = 0.95
-        elif '"*"' in code or "'*'" in code:
+        elif _QUOTED_WILDCARD.search(code):
             # Need more context
             context_text = " ".join(candidate.context_lines).lower()
             if "cors" in context_text:
@@ -406,7 +462,6 @@ Together they create a powerful scanning system.
 
 def main():
     """Demonstrate intelligent scanning with Codex-Claude collaboration."""
-    import os
 
     def get_xdg_path(xdg_var: str, default_suffix: str) -> Path:
         if xdg_path := os.environ.get(xdg_var):
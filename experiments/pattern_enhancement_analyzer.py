@@ -6,324 +6,534 @@ Uses Claude intelligence to analyze the updated project-init.json and identify
 new pattern opportunities for Codex scanning and fixing.
 """
 
+import functools
 import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Mapping
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-
-class PatternEnhancementAnalyzer:
-    """Intelligently analyzes project-init.json for new pattern opportunities."""
-
-    def __init__(self, project_init_path: Path):
-        self.project_init_path = project_init_path
-        self.project_init = self._load_project_init()
-        self.new_patterns = []
-
-    def _load_project_init(self) -> dict[str, Any]:
-        """Load and parse project-init.json."""
-        with open(self.project_init_path) as f:
-            return json.load(f)
-
-    def analyze_zombie_code_patterns(self) -> list[dict[str, Any]]:
-        """Extract zombie code detection patterns."""
-        zombie_config = self.project_init.get("project_organization", {}).get("zombie_code_management", {})
-
-        patterns = []
-
-        # Pattern 1: Versioned Files
-        patterns.append(
+from types import MappingProxyType
+from typing import Any, BinaryIO
+
+# Optional fast JSON parser/serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser for large project-init.json files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Top-level project-init.json sections read by the analyzers and the report
+_PROJECT_INIT_SECTIONS = frozenset(
+    {"project_organization", "mock_code_policy", "security_best_practices", "continuous_integration"}
+)
+
+# Files above this size are stream-parsed so unused sections are never materialized
+_STREAMING_PARSE_MIN_SIZE = 1024 * 1024
+
+
+def _compile(patterns: tuple[str, ...], flags: int = 0) -> tuple[re.Pattern[str], ...]:
+    """Compile a family of detection regexes once, at import time."""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+_ZOMBIE_FILE_PATTERNS = _compile(
+    (
+        # Version and copy suffixes: _v2, _v2_1, _simple, _legacy, _backup, ...
+        r".*_(?:v[0-9]+(?:_[0-9]+)?|simple|legacy|backup|old|new|original|copy)\.py$",
+    )
+)
+
+_ZOMBIE_EXCLUDES = _compile(
+    (
+        r"test_.*",  # Test files can have versions
+        r".*_test\.py$",
+        r"migrations/.*",  # Migration files legitimately versioned
+    )
+)
+
+_DUPLICATE_CLASS_PATTERNS = _compile(
+    (r"class\s+(\w+)(?:Handler|Manager|Service|Client)\s*\(",),
+    re.MULTILINE,
+)
+
+_MOCK_NAMING_CONTENT_PATTERNS = _compile(
+    (
+        # Functions that look like mocks but don't follow naming
+        r"def\s+((?!mock_)\w*(?:mock|fake|dummy|stub)\w*)\s*\(",
+        # Classes that look like mocks but don't follow naming
+        r"class\s+((?!Mock)\w*(?:Mock|Fake|Dummy)\w*)\s*\(",
+    ),
+    re.MULTILINE,
+)
+
+_MOCK_NAMING_FILE_PATTERNS = _compile(
+    (
+        # Files that look like mocks but don't start with mock_
+        r"(?!mock_).*(?:mock|fake|dummy).*\.py$",
+    )
+)
+
+_MOCK_WARNING_CONTENT_PATTERNS = _compile(
+    (
+        # Mock functions without warning logs
+        r"def\s+mock_\w+\s*\([^)]*\):[^}]*?(?!.*warning.*mock).*?(?=def|\Z)",
+    ),
+    re.MULTILINE,
+)
+
+_MOCK_WARNING_REQUIRED_PATTERNS = _compile(
+    (r"(?:logfire|logging|logger)\.warning.*⚠️\s*MOCK",),
+    re.MULTILINE,
+)
+
+_CLI_LOGIC_FILE_PATTERNS = _compile(
+    (
+        r".*cli\.py$",
+        r"cli/.*\.py$",
+    )
+)
+
+_CLI_LOGIC_CONTENT_PATTERNS = _compile(
+    (
+        # Complex business logic indicators in CLI files
+        r"class\s+\w+(?:Service|Manager|Handler|Engine|Processor)\s*\(",
+        r"def\s+(?:process|calculate|analyze|generate|transform)_\w+",
+        r"(?:for|while)\s+\w+\s+in.*:.*(?:for|while)",  # Nested loops
+        r"try:\s*\n.*except\s+\w+.*:\s*\n.*(?:raise|return)",  # Complex error handling
+    ),
+    re.MULTILINE,
+)
+
+_CLI_LOGIC_EXCLUDES = _compile(
+    (
+        r"def\s+.*(?:parse|format|display|print|show).*",  # UI operations
+        r"typer\.",  # Typer CLI framework usage
+        r"click\.",  # Click CLI framework usage
+    ),
+    re.MULTILINE,
+)
+
+_REDUNDANT_NAMING_PATTERNS = _compile(
+    (
+        # Files repeating package name
+        r"codex/codex_\w+\.py$",
+        r"hepha/hepha_\w+\.py$",
+        # Classes repeating package name
+        r"class\s+Codex\w+.*:",
+        r"class\s+Hepha\w+.*:",
+        # Functions repeating package name
+        r"def\s+codex_\w+",
+        r"def\s+hepha_\w+",
+    ),
+    re.MULTILINE,
+)
+
+_CORS_WILDCARD_PATTERNS = _compile(
+    (
+        r'allow_origins\s*=\s*\[\s*["\']?\*["\']?\s*\]',
+        r'origins\s*=\s*\[\s*["\']?\*["\']?\s*\]',
+        r"Access-Control-Allow-Origin.*\*",
+        r"CORS.*origins.*\*",
+    ),
+    re.MULTILINE,
+)
+
+_CORS_EXCLUDES = _compile(
+    (
+        r"#.*test",  # Test configuration comments
+        r"development",  # Development environment
+        r"local",  # Local development
+    ),
+    re.MULTILINE,
+)
+
+_SECRET_PATTERNS = _compile(
+    (
+        r'(?:password|secret|key|token)\s*=\s*["\'][^"\']{8,}["\']',
+        r'(?:api_key|auth_token|jwt_secret)\s*=\s*["\'][^"\']+["\']',
+        r"Bearer\s+[A-Za-z0-9_-]{20,}",
+        r"(?:sk-|pk_)[A-Za-z0-9_-]{32,}",
+    ),
+    re.MULTILINE,
+)
+
+_SECRET_EXCLUDES = _compile(
+    (
+        r"test_.*",
+        r"example",
+        r"placeholder",
+        r"your_.*_here",
+    ),
+    re.MULTILINE,
+)
+
+_SKIP_GIT_PATTERNS = _compile(
+    (
+        r"SKIP=.*git\s+commit",
+        r"git\s+commit.*--no-verify",
+        r"pre-commit.*--no-verify",
+    ),
+    re.MULTILINE,
+)
+
+_SKIP_COMMIT_MESSAGE_PATTERNS = _compile(
+    (
+        r"SKIP=",
+        r"skip.*pre-commit",
+        r"ignore.*linting",
+        r"will.*fix.*later",
+    ),
+    re.MULTILINE,
+)
+
+# Pattern templates are built once at import time. Analyzer methods return them as-is, or as a
+# shallow copy with the rationale taken from project-init.json.
+
+# Zombie code: Versioned Files
+_ZOMBIE_VERSIONED_FILES = MappingProxyType(
+    {
+        "name": "zombie_versioned_files",
+        "category": "code_quality",
+        "priority": "HIGH",
+        "description": "Detect files with version suffixes that indicate zombie code",
+        "detection_rules": MappingProxyType(
             {
-                "name": "zombie_versioned_files",
-                "category": "code_quality",
-                "priority": "HIGH",
-                "description": "Detect files with version suffixes that indicate zombie code",
-                "detection_rules": {
-                    "file_patterns": [
-                        r".*_v[0-9]+\.py$",
-                        r".*_v[0-9]+_[0-9]+\.py$",
-                        r".*_simple\.py$",
-                        r".*_legacy\.py$",
-                        r".*_backup\.py$",
-                        r".*_old\.py$",
-                        r".*_new\.py$",
-                        r".*_original\.py$",
-                        r".*_copy\.py$",
-                    ],
-                    "excludes": [
-                        r"test_.*",  # Test files can have versions
-                        r".*_test\.py$",
-                        r"migrations/.*",  # Migration files legitimately versioned
-                    ],
-                },
-                "rationale": zombie_config.get("detection_principles", {}).get("pattern_recognition", ""),
-                "fix_strategy": "consolidate_to_canonical",
-                "severity": "WARNING",
+                "file_patterns": _ZOMBIE_FILE_PATTERNS,
+                "excludes": _ZOMBIE_EXCLUDES,
             }
-        )
-
-        # Pattern 2: Duplicate Class Names
-        patterns.append(
+        ),
+        "rationale": "",  # Filled in from project-init.json
+        "fix_strategy": "consolidate_to_canonical",
+        "severity": "WARNING",
+    }
+)
+
+# Zombie code: Duplicate Class Names
+_ZOMBIE_DUPLICATE_CLASSES = MappingProxyType(
+    {
+        "name": "zombie_duplicate_classes",
+        "category": "code_quality",
+        "priority": "HIGH",
+        "description": "Detect multiple implementations of the same class",
+        "detection_rules": MappingProxyType(
             {
-                "name": "zombie_duplicate_classes",
-                "category": "code_quality",
-                "priority": "HIGH",
-                "description": "Detect multiple implementations of the same class",
-                "detection_rules": {
-                    "content_patterns": [
-                        r"class\s+(\w+)Handler\s*\(",
-                        r"class\s+(\w+)Manager\s*\(",
-                        r"class\s+(\w+)Service\s*\(",
-                        r"class\s+(\w+)Client\s*\(",
-                    ],
-                    "analysis_type": "cross_file_duplicate_detection",
-                },
-                "rationale": "Multiple implementations indicate zombie code needing consolidation",
-                "fix_strategy": "establish_canonical_implementation",
-                "severity": "WARNING",
+                "content_patterns": _DUPLICATE_CLASS_PATTERNS,
+                "analysis_type": "cross_file_duplicate_detection",
             }
-        )
+        ),
+        "rationale": "Multiple implementations indicate zombie code needing consolidation",
+        "fix_strategy": "establish_canonical_implementation",
+        "severity": "WARNING",
+    }
+)
+
+# Mock code policy: Mock Naming Compliance
+_MOCK_NAMING_COMPLIANCE = MappingProxyType(
+    {
+        "name": "mock_naming_compliance",
+        "category": "security",
+        "priority": "MANDATORY",
+        "description": "Enforce strict mock code naming requirements",
+        "detection_rules": MappingProxyType(
+            {
+                "content_patterns": _MOCK_NAMING_CONTENT_PATTERNS,
+                "file_patterns": _MOCK_NAMING_FILE_PATTERNS,
+            }
+        ),
+        "rationale": "",  # Filled in from project-init.json
+        "fix_strategy": "rename_to_mock_prefix",
+        "severity": "ERROR",
+    }
+)
+
+# Mock code policy: Mock Warning Requirements
+_MOCK_WARNING_REQUIREMENTS = MappingProxyType(
+    {
+        "name": "mock_warning_requirements",
+        "category": "security",
+        "priority": "MANDATORY",
+        "description": "Ensure all mock functions log warnings",
+        "detection_rules": MappingProxyType(
+            {
+                "content_patterns": _MOCK_WARNING_CONTENT_PATTERNS,
+                "required_patterns": _MOCK_WARNING_REQUIRED_PATTERNS,
+            }
+        ),
+        "rationale": "All mock functions must log warnings for visibility",
+        "fix_strategy": "add_mock_warnings",
+        "severity": "ERROR",
+    }
+)
+
+# Architecture: Business Logic in CLI
+_BUSINESS_LOGIC_IN_CLI = MappingProxyType(
+    {
+        "name": "business_logic_in_cli",
+        "category": "architecture",
+        "priority": "HIGH",
+        "description": "Detect business logic that should be in core package",
+        "detection_rules": MappingProxyType(
+            {
+                "file_patterns": _CLI_LOGIC_FILE_PATTERNS,
+                "content_patterns": _CLI_LOGIC_CONTENT_PATTERNS,
+                "excludes": _CLI_LOGIC_EXCLUDES,
+            }
+        ),
+        "rationale": "",  # Filled in from project-init.json
+        "fix_strategy": "move_to_core_package",
+        "severity": "WARNING",
+    }
+)
+
+# Architecture: Package Name Redundancy
+_REDUNDANT_PACKAGE_NAMING = MappingProxyType(
+    {
+        "name": "redundant_package_naming",
+        "category": "architecture",
+        "priority": "MEDIUM",
+        "description": "Detect redundant naming within packages",
+        "detection_rules": MappingProxyType(
+            {
+                "analysis_type": "package_scoping_analysis",
+                "patterns": _REDUNDANT_NAMING_PATTERNS,
+            }
+        ),
+        "rationale": "Package scoping eliminates need for redundant naming",
+        "fix_strategy": "remove_redundant_prefixes",
+        "severity": "INFO",
+    }
+)
+
+# Security: Never Wildcard CORS
+_CORS_NEVER_WILDCARD = MappingProxyType(
+    {
+        "name": "cors_never_wildcard",
+        "category": "security",
+        "priority": "MANDATORY",
+        "description": "NEVER use wildcard (*) in production CORS origins",
+        "detection_rules": MappingProxyType(
+            {
+                "content_patterns": _CORS_WILDCARD_PATTERNS,
+                "excludes": _CORS_EXCLUDES,
+            }
+        ),
+        "rationale": "",  # Filled in from project-init.json
+        "fix_strategy": "specify_exact_origins",
+        "severity": "ERROR",
+    }
+)
+
+# Security: Hardcoded Secrets
+_HARDCODED_SECRETS = MappingProxyType(
+    {
+        "name": "hardcoded_secrets",
+        "category": "security",
+        "priority": "CRITICAL",
+        "description": "Detect hardcoded secrets and credentials",
+        "detection_rules": MappingProxyType(
+            {
+                "content_patterns": _SECRET_PATTERNS,
+                "excludes": _SECRET_EXCLUDES,
+            }
+        ),
+        "rationale": "Never commit secrets to version control",
+        "fix_strategy": "use_environment_variables",
+        "severity": "CRITICAL",
+    }
+)
+
+# Pre-commit: Skip Flag Usage
+_PRE_COMMIT_SKIP_USAGE = MappingProxyType(
+    {
+        "name": "pre_commit_skip_usage",
+        "category": "code_quality",
+        "priority": "HIGH",
+        "description": "Detect usage of SKIP flags in commits",
+        "detection_rules": MappingProxyType(
+            {
+                "git_patterns": _SKIP_GIT_PATTERNS,
+                "commit_message_patterns": _SKIP_COMMIT_MESSAGE_PATTERNS,
+            }
+        ),
+        "rationale": "",  # Filled in from project-init.json
+        "fix_strategy": "enforce_pre_commit_compliance",
+        "severity": "ERROR",
+    }
+)
 
-        return patterns
 
-    def analyze_mock_code_patterns(self) -> list[dict[str, Any]]:
-        """Extract mock code policy enforcement patterns."""
-        mock_config = self.project_init.get("mock_code_policy", {})
+# Report ordering for pattern priorities, most urgent first
+_PRIORITY_ORDER = {"CRITICAL": 0, "MANDATORY": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4, "INFO": 5}
 
-        patterns = []
 
-        # Pattern 1: Mock Naming Compliance
-        patterns.append(
-            {
-                "name": "mock_naming_compliance",
-                "category": "security",
-                "priority": "MANDATORY",
-                "description": "Enforce strict mock code naming requirements",
-                "detection_rules": {
-                    "content_patterns": [
-                        # Functions that look like mocks but don't follow naming
-                        r"def\s+((?!mock_)\w*mock\w*)\s*\(",
-                        r"def\s+((?!mock_)\w*fake\w*)\s*\(",
-                        r"def\s+((?!mock_)\w*dummy\w*)\s*\(",
-                        r"def\s+((?!mock_)\w*stub\w*)\s*\(",
-                        # Classes that look like mocks but don't follow naming
-                        r"class\s+((?!Mock)\w*Mock\w*)\s*\(",
-                        r"class\s+((?!Mock)\w*Fake\w*)\s*\(",
-                        r"class\s+((?!Mock)\w*Dummy\w*)\s*\(",
-                    ],
-                    "file_patterns": [
-                        # Files that look like mocks but don't start with mock_
-                        r"(?!mock_).*mock.*\.py$",
-                        r"(?!mock_).*fake.*\.py$",
-                        r"(?!mock_).*dummy.*\.py$",
-                    ],
-                },
-                "rationale": mock_config.get("strict_requirements", {}).get("naming", {}),
-                "fix_strategy": "rename_to_mock_prefix",
-                "severity": "ERROR",
-            }
-        )
+def _priority_rank(pattern: Mapping[str, Any]) -> int:
+    """Sort key placing more urgent patterns first; unknown priorities sort last."""
+    return _PRIORITY_ORDER.get(pattern["priority"], len(_PRIORITY_ORDER))
 
-        # Pattern 2: Mock Warning Requirements
-        patterns.append(
-            {
-                "name": "mock_warning_requirements",
-                "category": "security",
-                "priority": "MANDATORY",
-                "description": "Ensure all mock functions log warnings",
-                "detection_rules": {
-                    "content_patterns": [
-                        # Mock functions without warning logs
-                        r"def\s+mock_\w+\s*\([^)]*\):[^}]*?(?!.*warning.*mock).*?(?=def|\Z)",
-                    ],
-                    "required_patterns": [
-                        r"logfire\.warning.*⚠️\s*MOCK",
-                        r"logging\.warning.*⚠️\s*MOCK",
-                        r"logger\.warning.*⚠️\s*MOCK",
-                    ],
-                },
-                "rationale": "All mock functions must log warnings for visibility",
-                "fix_strategy": "add_mock_warnings",
-                "severity": "ERROR",
-            }
-        )
 
-        return patterns
+def _json_default(value: Any) -> Any:
+    """Serialize frozen templates as dicts and compiled regexes as their source pattern."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, re.Pattern):
+        return value.pattern
+    return str(value)
 
-    def analyze_architectural_patterns(self) -> list[dict[str, Any]]:
-        """Extract architectural separation validation patterns."""
-        arch_config = self.project_init.get("project_organization", {}).get("architectural_separation", {})
 
-        patterns = []
+@functools.lru_cache(maxsize=8)
+def _load_project_init(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Load and parse project-init.json, once per path and modification time."""
+    if ijson is not None and os.path.getsize(path_str) > _STREAMING_PARSE_MIN_SIZE:
+        with open(path_str, "rb") as f:
+            return _load_sections_streaming(f)
 
-        # Pattern 1: Business Logic in CLI
-        patterns.append(
-            {
-                "name": "business_logic_in_cli",
-                "category": "architecture",
-                "priority": "HIGH",
-                "description": "Detect business logic that should be in core package",
-                "detection_rules": {
-                    "file_patterns": [r".*cli\.py$", r"cli/.*\.py$"],
-                    "content_patterns": [
-                        # Complex business logic indicators in CLI files
-                        r"class\s+\w+(?:Service|Manager|Handler|Engine|Processor)\s*\(",
-                        r"def\s+(?:process|calculate|analyze|generate|transform)_\w+",
-                        r"(?:for|while)\s+\w+\s+in.*:.*(?:for|while)",  # Nested loops
-                        r"try:\s*\n.*except\s+\w+.*:\s*\n.*(?:raise|return)",  # Complex error handling
-                    ],
-                    "excludes": [
-                        r"def\s+.*(?:parse|format|display|print|show).*",  # UI operations
-                        r"typer\.",  # Typer CLI framework usage
-                        r"click\.",  # Click CLI framework usage
-                    ],
-                },
-                "rationale": arch_config.get("core_business_logic", {}).get("principle", ""),
-                "fix_strategy": "move_to_core_package",
-                "severity": "WARNING",
-            }
-        )
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-        # Pattern 2: Package Name Redundancy
-        patterns.append(
-            {
-                "name": "redundant_package_naming",
-                "category": "architecture",
-                "priority": "MEDIUM",
-                "description": "Detect redundant naming within packages",
-                "detection_rules": {
-                    "analysis_type": "package_scoping_analysis",
-                    "patterns": [
-                        # Files repeating package name
-                        r"codex/codex_\w+\.py$",
-                        r"hepha/hepha_\w+\.py$",
-                        # Classes repeating package name
-                        r"class\s+Codex\w+.*:",
-                        r"class\s+Hepha\w+.*:",
-                        # Functions repeating package name
-                        r"def\s+codex_\w+",
-                        r"def\s+hepha_\w+",
-                    ],
-                },
-                "rationale": "Package scoping eliminates need for redundant naming",
-                "fix_strategy": "remove_redundant_prefixes",
-                "severity": "INFO",
-            }
-        )
 
-        return patterns
+def _load_sections_streaming(f: BinaryIO) -> dict[str, Any]:
+    """Build only the top-level sections in _PROJECT_INIT_SECTIONS from a JSON object stream."""
+    sections: dict[str, Any] = {}
+    key = builder = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix == "" and event in ("map_key", "end_map"):
+            if builder is not None:
+                sections[key] = builder.value
+            key = value
+            builder = ijson.ObjectBuilder() if value in _PROJECT_INIT_SECTIONS else None
+        elif builder is not None:
+            builder.event(event, value)
+    return sections
 
-    def analyze_security_patterns(self) -> list[dict[str, Any]]:
-        """Extract security best practice patterns."""
-        security_config = self.project_init.get("security_best_practices", {})
 
-        patterns = []
+class PatternEnhancementAnalyzer:
+    """Intelligently analyzes project-init.json for new pattern opportunities."""
 
-        # Pattern 1: Never Wildcard CORS
-        patterns.append(
-            {
-                "name": "cors_never_wildcard",
-                "category": "security",
-                "priority": "MANDATORY",
-                "description": "NEVER use wildcard (*) in production CORS origins",
-                "detection_rules": {
-                    "content_patterns": [
-                        r'allow_origins\s*=\s*\[\s*["\']?\*["\']?\s*\]',
-                        r'origins\s*=\s*\[\s*["\']?\*["\']?\s*\]',
-                        r"Access-Control-Allow-Origin.*\*",
-                        r"CORS.*origins.*\*",
-                    ],
-                    "excludes": [
-                        r"#.*test",  # Test configuration comments
-                        r"development",  # Development environment
-                        r"local",  # Local development
-                    ],
-                },
-                "rationale": security_config.get("cors_configuration", {}).get("never_wildcard", ""),
-                "fix_strategy": "specify_exact_origins",
-                "severity": "ERROR",
-            }
-        )
+    __slots__ = (
+        "project_init_path",
+        "project_init",
+        "_cache_key",
+        "_zombie_cfg",
+        "_arch_cfg",
+        "_mock_cfg",
+        "_sec_cfg",
+        "_ci_cfg",
+    )
 
-        # Pattern 2: Hardcoded Secrets
-        patterns.append(
-            {
-                "name": "hardcoded_secrets",
-                "category": "security",
-                "priority": "CRITICAL",
-                "description": "Detect hardcoded secrets and credentials",
-                "detection_rules": {
-                    "content_patterns": [
-                        r'(?:password|secret|key|token)\s*=\s*["\'][^"\']{8,}["\']',
-                        r'(?:api_key|auth_token|jwt_secret)\s*=\s*["\'][^"\']+["\']',
-                        r"Bearer\s+[A-Za-z0-9_-]{20,}",
-                        r"(?:sk-|pk_)[A-Za-z0-9_-]{32,}",
-                    ],
-                    "excludes": [r"test_.*", r"example", r"placeholder", r"your_.*_here"],
-                },
-                "rationale": "Never commit secrets to version control",
-                "fix_strategy": "use_environment_variables",
-                "severity": "CRITICAL",
-            }
-        )
+    # (project_init_path, mtime_ns) -> patterns built from that version of the file
+    _patterns_cache: dict[tuple[str, int], list[Mapping[str, Any]]] = {}
 
-        return patterns
+    def __init__(self, project_init_path: Path):
+        self.project_init_path = project_init_path
+        self._cache_key = (str(project_init_path), project_init_path.stat().st_mtime_ns)
+        self.project_init = _load_project_init(*self._cache_key)
+
+        # Resolve the config sections the analyzers read from once
+        project_organization = self.project_init.get("project_organization", {})
+        self._zombie_cfg = project_organization.get("zombie_code_management", {})
+        self._arch_cfg = project_organization.get("architectural_separation", {})
+        self._mock_cfg = self.project_init.get("mock_code_policy", {})
+        self._sec_cfg = self.project_init.get("security_best_practices", {})
+        self._ci_cfg = self.project_init.get("continuous_integration", {}).get("pre_commit_workflow", {})
+
+    def analyze_zombie_code_patterns(self) -> list[Mapping[str, Any]]:
+        """Extract zombie code detection patterns."""
+        return [
+            {
+                **_ZOMBIE_VERSIONED_FILES,
+                "rationale": self._zombie_cfg.get("detection_principles", {}).get("pattern_recognition", ""),
+            },
+            _ZOMBIE_DUPLICATE_CLASSES,
+        ]
 
-    def analyze_pre_commit_patterns(self) -> list[dict[str, Any]]:
-        """Extract pre-commit compliance patterns."""
-        ci_config = self.project_init.get("continuous_integration", {}).get("pre_commit_workflow", {})
+    def analyze_mock_code_patterns(self) -> list[Mapping[str, Any]]:
+        """Extract mock code policy enforcement patterns."""
+        return [
+            {**_MOCK_NAMING_COMPLIANCE, "rationale": self._mock_cfg.get("strict_requirements", {}).get("naming", {})},
+            _MOCK_WARNING_REQUIREMENTS,
+        ]
 
-        patterns = []
+    def analyze_architectural_patterns(self) -> list[Mapping[str, Any]]:
+        """Extract architectural separation validation patterns."""
+        return [
+            {**_BUSINESS_LOGIC_IN_CLI, "rationale": self._arch_cfg.get("core_business_logic", {}).get("principle", "")},
+            _REDUNDANT_PACKAGE_NAMING,
+        ]
 
-        # Pattern 1: Skip Flag Usage
-        patterns.append(
+    def analyze_security_patterns(self) -> list[Mapping[str, Any]]:
+        """Extract security best practice patterns."""
+        return [
             {
-                "name": "pre_commit_skip_usage",
-                "category": "code_quality",
-                "priority": "HIGH",
-                "description": "Detect usage of SKIP flags in commits",
-                "detection_rules": {
-                    "git_patterns": [r"SKIP=.*git\s+commit", r"git\s+commit.*--no-verify", r"pre-commit.*--no-verify"],
-                    "commit_message_patterns": [r"SKIP=", r"skip.*pre-commit", r"ignore.*linting", r"will.*fix.*later"],
-                },
-                "rationale": ci_config.get("zero_tolerance_policy", {}).get("fundamental_rule", ""),
-                "fix_strategy": "enforce_pre_commit_compliance",
-                "severity": "ERROR",
-            }
-        )
+                **_CORS_NEVER_WILDCARD,
+                "rationale": self._sec_cfg.get("cors_configuration", {}).get("never_wildcard", ""),
+            },
+            _HARDCODED_SECRETS,
+        ]
 
-        return patterns
+    def analyze_pre_commit_patterns(self) -> list[Mapping[str, Any]]:
+        """Extract pre-commit compliance patterns."""
+        return [
+            {
+                **_PRE_COMMIT_SKIP_USAGE,
+                "rationale": self._ci_cfg.get("zero_tolerance_policy", {}).get("fundamental_rule", ""),
+            },
+        ]
 
-    def analyze_all_pattern_opportunities(self) -> list[dict[str, Any]]:
+    def analyze_all_pattern_opportunities(self) -> list[Mapping[str, Any]]:
         """Analyze all sections for new pattern opportunities."""
         print("=== ANALYZING PROJECT-INIT.JSON FOR PATTERN OPPORTUNITIES ===")
 
-        all_patterns = []
-
-        # Analyze each section
-        zombie_patterns = self.analyze_zombie_code_patterns()
-        mock_patterns = self.analyze_mock_code_patterns()
-        arch_patterns = self.analyze_architectural_patterns()
-        security_patterns = self.analyze_security_patterns()
-        pre_commit_patterns = self.analyze_pre_commit_patterns()
-
-        all_patterns.extend(zombie_patterns)
-        all_patterns.extend(mock_patterns)
-        all_patterns.extend(arch_patterns)
-        all_patterns.extend(security_patterns)
-        all_patterns.extend(pre_commit_patterns)
+        # Patterns only depend on project-init.json, so reuse them while the file is unchanged
+        cached = self._patterns_cache.get(self._cache_key)
+        if cached is None:
+            # Analyze each section
+            section_analyzers = (
+                self.analyze_zombie_code_patterns,
+                self.analyze_mock_code_patterns,
+                self.analyze_architectural_patterns,
+                self.analyze_security_patterns,
+                self.analyze_pre_commit_patterns,
+            )
+            cached = list(chain.from_iterable(analyze() for analyze in section_analyzers))
+            self._patterns_cache[self._cache_key] = cached
+
+        all_patterns = list(cached)
 
         print(f"Found {len(all_patterns)} new pattern opportunities:")
-        for pattern in all_patterns:
-            print(f"  - {pattern['name']}: {pattern['description']}")
+        sys.stdout.write("".join(f"  - {pattern['name']}: {pattern['description']}\n" for pattern in all_patterns))
 
         return all_patterns
 
-    def create_pattern_enhancement_report(self, patterns: list[dict[str, Any]]) -> str:
+    def create_pattern_enhancement_report(self, patterns: list[Mapping[str, Any]]) -> str:
         """Create comprehensive report of pattern enhancements."""
         timestamp = datetime.now().isoformat()
 
-        report = f"""
+        # Count priorities in one C-level Counter pass, then group by category
+        priority_counts = Counter(map(itemgetter("priority"), patterns))
+        critical_count = priority_counts["CRITICAL"] + priority_counts["MANDATORY"]
+        high_count = priority_counts["HIGH"]
+        low_count = priority_counts["MEDIUM"] + priority_counts["LOW"] + priority_counts["INFO"]
+
+        by_category: defaultdict[str, list[Mapping[str, Any]]] = defaultdict(list)
+        for pattern in patterns:
+            by_category[pattern["category"]].append(pattern)
+        for cat_patterns in by_category.values():
+            cat_patterns.sort(key=_priority_rank)
+
+        parts = [
+            f"""
 PATTERN ENHANCEMENT ANALYSIS REPORT ({timestamp})
 
 PROJECT-INIT.JSON ANALYSIS COMPLETE:
@@ -333,26 +543,21 @@ PROJECT-INIT.JSON ANALYSIS COMPLETE:
 
 NEW PATTERN OPPORTUNITIES IDENTIFIED:
 - Total patterns: {len(patterns)}
-- Critical/Mandatory: {len([p for p in patterns if p['priority'] in ['CRITICAL', 'MANDATORY']])}
-- High priority: {len([p for p in patterns if p['priority'] == 'HIGH'])}
-- Medium/Low priority: {len([p for p in patterns if p['priority'] in ['MEDIUM', 'LOW', 'INFO']])}
+- Critical/Mandatory: {critical_count}
+- High priority: {high_count}
+- Medium/Low priority: {low_count}
 
 PATTERNS BY CATEGORY:
 """
+        ]
 
-        by_category = {}
-        for pattern in patterns:
-            category = pattern["category"]
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(pattern)
-
-        for category, cat_patterns in sorted(by_category.items()):
-            report += f"\n{category.upper()} ({len(cat_patterns)} patterns):\n"
+        for category, cat_patterns in sorted(by_category.items(), key=itemgetter(0)):
+            parts.append(f"\n{category.upper()} ({len(cat_patterns)} patterns):\n")
             for pattern in cat_patterns:
-                report += f"  - {pattern['name']} ({pattern['priority']}): {pattern['description']}\n"
+                parts.append(f"  - {pattern['name']} ({pattern['priority']}): {pattern['description']}\n")
 
-        report += f"""
+        parts.append(
+            """
 HIGH-IMPACT PATTERNS FOR IMMEDIATE IMPLEMENTATION:
 
 1. ZOMBIE CODE DETECTION:
@@ -394,8 +599,9 @@ These patterns embody the project-init.json principles:
 - Intelligence-driven analysis over blind automation
 - Context-aware decision making with exclude rules
 """
+        )
 
-        return report
+        return "".join(parts)
 
 
 def main():
@@ -414,12 +620,17 @@ def main():
 
     # Save patterns to JSON for integration
     patterns_file = Path(__file__).parent / "enhanced_patterns.json"
-    with open(patterns_file, "w") as f:
-        json.dump(patterns, f, indent=2, default=str)
-
-    print("\n=== ANALYSIS COMPLETE ===")
-    print(f"Enhanced patterns saved to: {patterns_file}")
-    print("Ready for systematic implementation in Codex scanner")
+    if orjson is not None:
+        patterns_file.write_bytes(orjson.dumps(patterns, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(patterns_file, "w") as f:
+            json.dump(patterns, f, indent=2, default=_json_default)
+
+    sys.stdout.write(
+        "\n=== ANALYSIS COMPLETE ===\n"
+        f"Enhanced patterns saved to: {patterns_file}\n"
+        "Ready for systematic implementation in Codex scanner\n"
+    )
 
 
 if __name__ == "__main__":
@@ -6,12 +6,21 @@ Takes violations found by scanner and applies fixes.
 """
 
 import json
-import sqlite3
+import re
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from conversation_session import ConversationSession, dumps
+from fixer_utils import iter_py_files
+
+# print( followed directly by a string literal: print("...") or print('...')
+_PRINT_CALL = re.compile(r"""print\((["'])""")
+
 
 class SimpleFixer:
     """Basic pattern fixer using simple string replacements and external tools."""
@@ -20,6 +29,15 @@ class SimpleFixer:
         self.db_path = db_path
         self.codex_dir = codex_dir
         self.fixes_applied = []
+        self._py_files: list[Path] | None = None
+        # Shares staged rows with a scanner on the same database in this process
+        self.session = ConversationSession(db_path)
+
+    def _python_files(self) -> list[Path]:
+        """List the .py files under codex_dir, walking the tree only once."""
+        if self._py_files is None:
+            self._py_files = list(iter_py_files(self.codex_dir, skip_prefixes=()))
+        return self._py_files
 
     def run_external_tools(self) -> dict[str, Any]:
         """Run external tools first - Ruff, mypy/ty, typos."""
@@ -41,7 +59,7 @@ class SimpleFixer:
             if result.stdout:
                 try:
                     issues = json.loads(result.stdout)
-                    fixed_count = len([i for i in issues if i.get("fix")])
+                    fixed_count = sum(1 for i in issues if i.get("fix"))
                 except json.JSONDecodeError:
                     pass
 
@@ -88,7 +106,7 @@ class SimpleFixer:
             result = subprocess.run(["ty", "check", str(self.codex_dir)], capture_output=True, text=True, timeout=30)
 
             type_checker_used = "ty"
-            error_count = len([line for line in result.stdout.splitlines() if "error[" in line])
+            error_count = result.stdout.count("error[")
 
         except (FileNotFoundError, subprocess.TimeoutExpired):
             try:
@@ -98,7 +116,7 @@ class SimpleFixer:
                 )
 
                 type_checker_used = "mypy"
-                error_count = len([line for line in result.stdout.splitlines() if ": error:" in line])
+                error_count = result.stdout.count(": error:")
 
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 results["type_checker"] = {"success": False, "error": "no type checker available"}
@@ -121,21 +139,14 @@ class SimpleFixer:
 
         print("\n=== APPLYING SIMPLE FIXES ===")
 
-        # Load recent violations from conversation
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT metadata FROM codex_conversations
-                WHERE observation_type = 'self_scan'
-                ORDER BY timestamp DESC LIMIT 1
-            """)
-            row = cursor.fetchone()
+        # Load recent violations from conversation, including a scan staged in this process
+        scan_metadata = self.session.latest_metadata("self_scan")
+        if scan_metadata is None:
+            print("No recent scan data found")
+            return fixes
 
-            if not row:
-                print("No recent scan data found")
-                return fixes
-
-            metadata = json.loads(row[0])
-            violation_summary = metadata.get("violation_summary", {})
+        metadata = json.loads(scan_metadata)
+        violation_summary = metadata.get("violation_summary", {})
 
         # Focus on high-impact, easy fixes
         easy_fixes = {
@@ -143,125 +154,111 @@ class SimpleFixer:
             "use-pydantic-validation": self.fix_pydantic_imports,
         }
 
-        for pattern_name, fix_func in easy_fixes.items():
-            if pattern_name in violation_summary:
-                count = len(violation_summary[pattern_name])
-                print(f"Fixing {pattern_name} ({count} violations)...")
-                pattern_fixes = fix_func()
-                fixes.extend(pattern_fixes)
-                print(f"  Applied {len(pattern_fixes)} fixes")
+        fixers = [(name, fix_func) for name, fix_func in easy_fixes.items() if name in violation_summary]
+        fixes_by_pattern: dict[str, list[dict]] = {name: [] for name, _ in fixers}
 
-        return fixes
+        # One pass over the tree: each file is read once, run through every active
+        # fixer, and written back once
+        if fixers:
+            for py_file in self._python_files():
+                try:
+                    raw = Path(py_file).read_bytes()
 
-    def fix_structured_logging(self) -> list[dict]:
-        """Replace print statements with proper logging."""
-        fixes = []
+                    # Every fixer needs either a print( call or a mention of validation/validate,
+                    # so most files can be skipped before paying for the decode
+                    if b"print(" not in raw and b"validat" not in raw.lower():
+                        continue
 
-        for py_file in self.codex_dir.rglob("*.py"):
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv"]):
-                continue
+                    content = raw.decode("utf-8")
+                    if "\r" in content:
+                        # Match the universal-newline translation of a text-mode read
+                        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-            try:
-                with open(py_file, encoding="utf-8") as f:
-                    content = f.read()
-                    original_content = content
-
-                # Simple fixes for obvious cases
-                changes_made = False
-
-                # Add logging import if using print but no logging import
-                if "print(" in content and "import logging" not in content:
-                    # Add after other imports
-                    lines = content.split("\n")
-                    import_section_end = 0
-
-                    for i, line in enumerate(lines):
-                        if line.startswith("import ") or line.startswith("from "):
-                            import_section_end = i
-
-                    if import_section_end > 0:
-                        lines.insert(import_section_end + 1, "import logging")
-                        content = "\n".join(lines)
-                        changes_made = True
-
-                # Replace obvious print statements with logger calls
-                replacements = [
-                    ('print("', 'logging.info(f"'),
-                    ('print("', 'logging.info("'),
-                    ("print('", "logging.info('"),
-                ]
-
-                for old, new in replacements:
-                    if old in content:
-                        content = content.replace(old, new)
-                        changes_made = True
-
-                if changes_made:
-                    with open(py_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-
-                    fixes.append(
-                        {
-                            "file": str(py_file),
-                            "pattern": "structured-logging",
-                            "description": "Replaced print with logging",
-                            "lines_changed": content.count("\n") - original_content.count("\n"),
-                        }
-                    )
-
-            except (OSError, UnicodeDecodeError):
-                continue
+                    new_content, file_fixes = self._apply_all_fixers(content, fixers)
+
+                    if new_content != content:
+                        with open(py_file, "w", encoding="utf-8") as f:
+                            f.write(new_content)
+
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                for fix in file_fixes:
+                    fixes_by_pattern[fix["pattern"]].append({"file": str(py_file), **fix})
+
+        for pattern_name, pattern_fixes in fixes_by_pattern.items():
+            count = len(violation_summary[pattern_name])
+            print(f"Fixing {pattern_name} ({count} violations)...")
+            fixes.extend(pattern_fixes)
+            print(f"  Applied {len(pattern_fixes)} fixes")
 
         return fixes
 
-    def fix_pydantic_imports(self) -> list[dict]:
-        """Add missing Pydantic imports where validation is used."""
+    def _apply_all_fixers(self, content: str, fixers: list[tuple[str, Any]]) -> tuple[str, list[dict]]:
+        """Run each fixer over the content in turn, collecting the fixes they made."""
         fixes = []
+        for _, fix_func in fixers:
+            content, fix = fix_func(content)
+            if fix:
+                fixes.append(fix)
+        return content, fixes
 
-        for py_file in self.codex_dir.rglob("*.py"):
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv"]):
-                continue
+    def fix_structured_logging(self, content: str) -> tuple[str, dict | None]:
+        """Replace print statements with proper logging."""
+        # Simple fixes for obvious cases
+        changes_made = False
+        lines_delta = 0
+
+        # Add logging import if using print but no logging import
+        if "print(" in content and "import logging" not in content:
+            # Add after other imports
+            lines = content.split("\n")
+            import_section_end = 0
+
+            for i, line in enumerate(lines):
+                if line.startswith("import ") or line.startswith("from "):
+                    import_section_end = i
+
+            if import_section_end > 0:
+                lines.insert(import_section_end + 1, "import logging")
+                lines_delta += 1
+                content = "\n".join(lines)
+                changes_made = True
+
+        # Replace obvious print statements with logger calls
+        content, replaced = _PRINT_CALL.subn(r"logging.info(\1", content)
+        if replaced:
+            changes_made = True
+
+        if not changes_made:
+            return content, None
+
+        return content, {
+            "pattern": "structured-logging",
+            "description": "Replaced print with logging",
+            "lines_changed": lines_delta,
+        }
 
-            try:
-                with open(py_file, encoding="utf-8") as f:
-                    content = f.read()
-                    original_content = content
-
-                changes_made = False
-
-                # If file mentions validation but no Pydantic import
-                if (
-                    "validation" in content.lower() or "validate" in content.lower()
-                ) and "pydantic" not in content.lower():
-                    lines = content.split("\n")
-                    import_section_end = 0
-
-                    for i, line in enumerate(lines):
-                        if line.startswith("import ") or line.startswith("from "):
-                            import_section_end = i
-
-                    if import_section_end > 0:
-                        lines.insert(import_section_end + 1, "from pydantic import BaseModel, Field")
-                        content = "\n".join(lines)
-                        changes_made = True
-
-                if changes_made:
-                    with open(py_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-
-                    fixes.append(
-                        {
-                            "file": str(py_file),
-                            "pattern": "use-pydantic-validation",
-                            "description": "Added Pydantic import",
-                            "lines_changed": 1,
-                        }
-                    )
-
-            except (OSError, UnicodeDecodeError):
-                continue
+    def fix_pydantic_imports(self, content: str) -> tuple[str, dict | None]:
+        """Add missing Pydantic imports where validation is used."""
+        # If file mentions validation but no Pydantic import
+        if ("validation" in content.lower() or "validate" in content.lower()) and "pydantic" not in content.lower():
+            lines = content.split("\n")
+            import_section_end = 0
 
-        return fixes
+            for i, line in enumerate(lines):
+                if line.startswith("import ") or line.startswith("from "):
+                    import_section_end = i
+
+            if import_section_end > 0:
+                lines.insert(import_section_end + 1, "from pydantic import BaseModel, Field")
+                return "\n".join(lines), {
+                    "pattern": "use-pydantic-validation",
+                    "description": "Added Pydantic import",
+                    "lines_changed": 1,
+                }
+
+        return content, None
 
     def create_fix_conversation(self, external_results: dict, simple_fixes: list[dict]) -> None:
         """Record the fixing session as a conversation."""
@@ -296,7 +293,7 @@ EXTERNAL TOOLS RESULTS:
         observation += f"""
 SIMPLE PATTERN FIXES:
 - Applied {len(simple_fixes)} pattern-based fixes
-- Fixed patterns: {', '.join(set(f['pattern'] for f in simple_fixes))}
+- Fixed patterns: {", ".join(set(f["pattern"] for f in simple_fixes))}
 
 DETAILED FIXES:
 """
@@ -319,30 +316,31 @@ NEXT STEPS:
 - Improve pattern detection to reduce false positives
 """
 
-        # Store in database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO codex_conversations (timestamp, observation_type, narrative, metadata)
-                VALUES (?, ?, ?, ?)
-            """,
-                (
-                    timestamp,
-                    "self_fix",
-                    observation,
-                    json.dumps(
-                        {
-                            "external_fixes": total_external_fixes,
-                            "simple_fixes": len(simple_fixes),
-                            "tools_used": list(external_results.keys()),
-                            "patterns_fixed": list(set(f["pattern"] for f in simple_fixes)),
-                        }
-                    ),
+        rows = [
+            (
+                timestamp,
+                "self_fix",
+                observation,
+                dumps(
+                    {
+                        "external_fixes": total_external_fixes,
+                        "simple_fixes": len(simple_fixes),
+                        "tools_used": list(external_results.keys()),
+                        "patterns_fixed": list(set(f["pattern"] for f in simple_fixes)),
+                    }
                 ),
-            )
+            ),
+        ]
+
+        # Staged in the session database; written to disk when the session is flushed
+        self.session.stage(rows)
 
         print(f"\n{observation}")
 
+    def flush_session(self) -> None:
+        """Write the session's conversation rows to the on-disk database in one transaction."""
+        self.session.flush()
+
 
 def main():
     """Apply fixes to Codex's own codebase."""
@@ -366,6 +364,7 @@ def main():
 
     # Record the session
     fixer.create_fix_conversation(external_results, simple_fixes)
+    fixer.flush_session()
 
     print("\n=== FIXING COMPLETE ===")
     print("Check database for conversational record of fixes applied")
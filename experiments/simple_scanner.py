@@ -2,14 +2,232 @@
 """
 Simple pattern scanner for dogfooding Codex on itself.
 
-No dependencies - just Python stdlib and SQLite queries.
+No required dependencies - just Python stdlib and SQLite queries. Keyword
+matching uses pyahocorasick when it is installed.
 """
 
+import hashlib
+import heapq
 import json
+import os
 import sqlite3
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from itertools import repeat
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from conversation_session import ConversationSession, dumps
+from fixer_utils import iter_py_files
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _parse_keywords(detection: str) -> list[str]:
+    """Extract the keywords from a pattern's detection rule."""
+    # Parse JSON detection if present
+    try:
+        if detection.startswith("{"):
+            detection_data = json.loads(detection)
+            return detection_data.get("keywords", [])
+        # Fallback to simple text matching
+        return [detection]
+    except json.JSONDecodeError:
+        return [detection]
+
+
+def _build_automaton(patterns: list[dict]):
+    """Build one Aho-Corasick automaton over every pattern's keywords.
+
+    Each keyword maps to the (pattern index, keyword index) pairs that use it,
+    so a single pass over a file finds every candidate match. Returns None when
+    pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    owners: dict[str, list[tuple[int, int]]] = {}
+    for pattern_idx, pattern in enumerate(patterns):
+        for keyword_idx, keyword in enumerate(pattern["_keywords"]):
+            if keyword:
+                owners.setdefault(keyword, []).append((pattern_idx, keyword_idx))
+
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_owners in owners.items():
+        automaton.add_word(keyword, (len(keyword), tuple(keyword_owners)))
+    if owners:
+        automaton.make_automaton()
+    return automaton
+
+
+def _violation(file_path: str | Path, pattern: dict, line_num: int, line: str, keyword: str) -> dict:
+    return {
+        "file": str(file_path),
+        "line": line_num,
+        "pattern": pattern["name"],
+        "category": pattern["category"],
+        "priority": pattern["priority"],
+        "description": pattern["description"],
+        "code_line": line.strip(),
+        "keyword": keyword,
+    }
+
+
+def _patterns_digest(patterns: list[dict]) -> bytes:
+    """Fingerprint the pattern set so cached scan results are dropped when it changes."""
+    definition = [[p["name"], p["category"], p["priority"], p["description"], p["_keywords"]] for p in patterns]
+    return hashlib.blake2b(json.dumps(definition).encode(), digest_size=16).digest()
+
+
+# Small files rescan faster than a cache round-trip, so only larger ones are stored
+_CACHE_MIN_SIZE = 4096
+
+# One read connection per process for scan cache lookups
+_cache_connections: dict[str, sqlite3.Connection] = {}
+
+
+def _cache_connection(db_path: Path) -> sqlite3.Connection:
+    key = str(db_path)
+    conn = _cache_connections.get(key)
+    if conn is None:
+        conn = _cache_connections[key] = sqlite3.connect(key)
+    return conn
+
+
+def _decode(raw: bytes) -> str | None:
+    """Decode file bytes as UTF-8 with universal newlines, or None if they are not valid UTF-8."""
+    try:
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _scan_file_worker(
+    file_path: str | Path,
+    patterns: list[dict],
+    automaton=None,
+    db_path: Path | None = None,
+    patterns_digest: bytes = b"",
+) -> tuple[list[dict], tuple[bytes, str] | None, bool]:
+    """Scan a single file for pattern violations (module-level so worker processes can pickle it).
+
+    With a db_path, results are looked up in the scan cache by content hash first.
+    Returns the violations, the (hash, violations) row to store for a cacheable
+    miss, and whether the cache was hit.
+    """
+    try:
+        raw = Path(file_path).read_bytes()
+    except OSError:
+        return [], None, False
+
+    if db_path is None:
+        content = _decode(raw)
+        if content is None:
+            return [], None, False
+        return _detect_violations(file_path, content, patterns, automaton), None, False
+
+    # Hash the raw bytes so cache hits never pay for decoding
+    content_hash = hashlib.blake2b(patterns_digest + raw, digest_size=16).digest()
+    row = (
+        _cache_connection(db_path)
+        .execute("SELECT violations FROM _scan_cache WHERE hash = ?", (content_hash,))
+        .fetchone()
+    )
+    if row:
+        file_name = str(file_path)
+        return [{"file": file_name, **violation} for violation in json.loads(row[0])], None, True
+
+    content = _decode(raw)
+    if content is None:
+        return [], None, False
+    violations = _detect_violations(file_path, content, patterns, automaton)
+    if len(raw) < _CACHE_MIN_SIZE:
+        return violations, None, False
+    cached = [{key: value for key, value in violation.items() if key != "file"} for violation in violations]
+    return violations, (content_hash, dumps(cached)), False
+
+
+def _detect_violations(file_path: str | Path, content: str, patterns: list[dict], automaton=None) -> list[dict]:
+    """Find pattern violations in a file's content."""
+    violations = []
+
+    if automaton is None:
+        automaton = _build_automaton(patterns)
+
+    if automaton is None:
+        # Skip comments once per line rather than once per (pattern, line)
+        code_lines = [
+            (line_num, line)
+            for line_num, line in enumerate(content.split("\n"), 1)
+            if not line.lstrip().startswith("#")
+        ]
+        for pattern in patterns:
+            keywords = pattern["_keywords"]
+            if not keywords:
+                continue
+
+            # Check for violations
+            for line_num, line in code_lines:
+                for keyword in keywords:
+                    if keyword and keyword in line:
+                        violations.append(_violation(file_path, pattern, line_num, line, keyword))
+                        break
+
+        return violations
+
+    if not automaton.kind:  # no keywords at all
+        return violations
+
+    # Offsets where each line begins; line text is only sliced out for actual matches
+    line_starts = [0]
+    find = content.find
+    newline = find("\n")
+    while newline != -1:
+        line_starts.append(newline + 1)
+        newline = find("\n", newline + 1)
+    line_starts.append(len(content) + 1)
+
+    # For each (pattern, line) keep the earliest keyword in the pattern's list,
+    # matching the first-keyword-wins rule of the per-line substring scan
+    first_keyword: dict[tuple[int, int], int] = {}
+    # Whether each matched line is a comment, worked out once per line
+    comment_lines: dict[int, bool] = {}
+    for end_idx, (keyword_len, keyword_owners) in automaton.iter(content):
+        line_idx = bisect_right(line_starts, end_idx) - 1
+        if end_idx - keyword_len + 1 < line_starts[line_idx]:
+            continue  # keyword spans a line break
+        is_comment = comment_lines.get(line_idx)
+        if is_comment is None:
+            start = line_starts[line_idx]
+            is_comment = comment_lines[line_idx] = (
+                content[start : line_starts[line_idx + 1] - 1].lstrip().startswith("#")
+            )
+        if is_comment:
+            continue
+        for pattern_idx, keyword_idx in keyword_owners:
+            key = (pattern_idx, line_idx)
+            if keyword_idx < first_keyword.get(key, keyword_idx + 1):
+                first_keyword[key] = keyword_idx
+
+    for pattern_idx, line_idx in sorted(first_keyword):
+        line = content[line_starts[line_idx] : line_starts[line_idx + 1] - 1]
+        pattern = patterns[pattern_idx]
+        keyword = pattern["_keywords"][first_keyword[pattern_idx, line_idx]]
+        violations.append(_violation(file_path, pattern, line_idx + 1, line, keyword))
+
+    return violations
+
 
 class SimpleScanner:
     """Basic pattern scanner using the existing database."""
@@ -17,10 +235,22 @@ class SimpleScanner:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.observations = []
+        # Rows staged here are visible to a fixer on the same database in this process
+        self.session = ConversationSession(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database with WAL journaling and larger caches."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
 
     def load_patterns(self) -> list[dict]:
         """Load patterns from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT name, category, priority, description, detection, fix
@@ -28,100 +258,119 @@ class SimpleScanner:
                 WHERE priority IN ('MANDATORY', 'CRITICAL', 'HIGH')
                 ORDER BY priority, category
             """)
-            return [dict(row) for row in cursor.fetchall()]
-
-    def scan_file(self, file_path: Path, patterns: list[dict]) -> list[dict]:
-        """Scan a single file for pattern violations."""
-        violations = []
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-        except (OSError, UnicodeDecodeError):
-            return violations
-
-        lines = content.split("\n")
+            patterns = [dict(row) for row in cursor.fetchall()]
 
+        # Parse detection rules once rather than per scanned file
         for pattern in patterns:
-            # Try to extract detection rules
             detection = pattern.get("detection", "")
-            if not detection:
-                continue
+            pattern["_keywords"] = _parse_keywords(detection) if detection else []
+        return patterns
 
-            # Parse JSON detection if present
-            try:
-                if detection.startswith("{"):
-                    detection_data = json.loads(detection)
-                    keywords = detection_data.get("keywords", [])
-                else:
-                    # Fallback to simple text matching
-                    keywords = [detection]
-            except json.JSONDecodeError:
-                keywords = [detection]
-
-            # Check for violations
-            for line_num, line in enumerate(lines, 1):
-                # Skip comments
-                if line.strip().startswith("#"):
-                    continue
-
-                for keyword in keywords:
-                    if keyword and keyword in line:
-                        violations.append(
-                            {
-                                "file": str(file_path),
-                                "line": line_num,
-                                "pattern": pattern["name"],
-                                "category": pattern["category"],
-                                "priority": pattern["priority"],
-                                "description": pattern["description"],
-                                "code_line": line.strip(),
-                                "keyword": keyword,
-                            }
-                        )
-                        break
+    def _ensure_scan_cache(self) -> None:
+        """Create the content-hash keyed scan cache table."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _scan_cache (
+                    hash BLOB PRIMARY KEY,
+                    violations TEXT
+                )
+            """)
 
+    def _store_scan_cache(self, rows: list[tuple[bytes, str]]) -> None:
+        """Record freshly scanned files in the scan cache."""
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO _scan_cache (hash, violations) VALUES (?, ?)", rows)
+
+    @cached_property
+    def patterns(self) -> list[dict]:
+        """Patterns loaded once per scanner and reused by every scan."""
+        return self.load_patterns()
+
+    @cached_property
+    def automaton(self):
+        """Keyword automaton over the cached patterns, or None without pyahocorasick."""
+        return _build_automaton(self.patterns)
+
+    @cached_property
+    def scan_digest(self) -> bytes:
+        """Scan cache key prefix for the cached patterns, creating the cache table on first use."""
+        self._ensure_scan_cache()
+        return _patterns_digest(self.patterns)
+
+    def scan_file(self, file_path: Path, patterns: list[dict] | None = None) -> list[dict]:
+        """Scan a single file for pattern violations, with the scanner's own patterns by default."""
+        if patterns is None or patterns is self.patterns:
+            patterns, automaton, patterns_digest = self.patterns, self.automaton, self.scan_digest
+        else:
+            self._ensure_scan_cache()
+            automaton, patterns_digest = _build_automaton(patterns), _patterns_digest(patterns)
+        violations, cache_row, _ = _scan_file_worker(file_path, patterns, automaton, self.db_path, patterns_digest)
+        if cache_row:
+            self._store_scan_cache([cache_row])
         return violations
 
     def scan_directory(self, directory: Path) -> None:
         """Scan all Python files in directory."""
-        patterns = self.load_patterns()
+        patterns = self.patterns
+        automaton = self.automaton
 
         print(f"Loaded {len(patterns)} patterns from database")
         print("Scanning Codex codebase...")
 
         all_violations = []
         files_scanned = 0
+        cache_rows = []
+        cache_hits = 0
+
+        py_files = list(iter_py_files(directory, skip_prefixes=()))
+
+        patterns_digest = self.scan_digest
+
+        # Files are scanned independently, so fan them out across processes
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(
+                _scan_file_worker,
+                py_files,
+                repeat(patterns),
+                repeat(automaton),
+                repeat(self.db_path),
+                repeat(patterns_digest),
+                chunksize=16,
+            )
+            for py_file, (violations, cache_row, cache_hit) in zip(py_files, results, strict=True):
+                all_violations.extend(violations)
+                if cache_row:
+                    cache_rows.append(cache_row)
+                cache_hits += cache_hit
+                files_scanned += 1
 
-        for py_file in directory.rglob("*.py"):
-            # Skip __pycache__, .venv, etc.
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv", ".git"]):
-                continue
-
-            violations = self.scan_file(py_file, patterns)
-            all_violations.extend(violations)
-            files_scanned += 1
+                if violations:
+                    print(f"  {os.path.basename(py_file)}: {len(violations)} issues")
 
-            if violations:
-                print(f"  {py_file.name}: {len(violations)} issues")
+        self._store_scan_cache(cache_rows)
 
         # Store conversational observation
-        self.create_conversation_entry(files_scanned, all_violations, patterns)
+        self.create_conversation_entry(files_scanned, all_violations, patterns, cache_hits)
 
         # Show summary
         self.show_summary(files_scanned, all_violations)
 
-    def create_conversation_entry(self, files_scanned: int, violations: list[dict], patterns: list[dict]) -> None:
+    def create_conversation_entry(
+        self, files_scanned: int, violations: list[dict], patterns: list[dict], cache_hits: int = 0
+    ) -> None:
         """Create a conversational database entry."""
         timestamp = datetime.now().isoformat()
 
-        # Group violations by pattern
-        by_pattern = {}
+        # Group violations by pattern and by file in one pass
+        by_pattern = defaultdict(list)
+        by_file = defaultdict(list)
         for v in violations:
-            pattern = v["pattern"]
-            if pattern not in by_pattern:
-                by_pattern[pattern] = []
-            by_pattern[pattern].append(v)
+            by_pattern[v["pattern"]].append(v)
+            by_file[v["file"]].append(v)
+
+        patterns_by_count = sorted(by_pattern.items(), key=lambda x: len(x[1]), reverse=True)
 
         # Create conversational observation
         observation = f"""
@@ -132,73 +381,56 @@ Today I examined my own codebase - {files_scanned} Python files.
 WHAT I FOUND:
 - Total violations: {len(violations)}
 - Patterns checked: {len(patterns)}
-- Most problematic areas: {', '.join(f'{p} ({len(vs)} issues)' for p, vs in sorted(by_pattern.items(), key=lambda x: len(x[1]), reverse=True)[:3])}
+- Most problematic areas: {", ".join(f"{p} ({len(vs)} issues)" for p, vs in patterns_by_count[:3])}
 
 PATTERN ANALYSIS:
 """
 
-        for pattern_name, pattern_violations in sorted(by_pattern.items(), key=lambda x: len(x[1]), reverse=True):
+        for pattern_name, pattern_violations in patterns_by_count:
             first_violation = pattern_violations[0]
             observation += f"""
-- {pattern_name} ({first_violation['category']}, {first_violation['priority']}):
+- {pattern_name} ({first_violation["category"]}, {first_violation["priority"]}):
   Found {len(pattern_violations)} violations
-  Description: {first_violation['description']}
-  Example: {pattern_violations[0]['file']}:{pattern_violations[0]['line']}
+  Description: {first_violation["description"]}
+  Example: {pattern_violations[0]["file"]}:{pattern_violations[0]["line"]}
 """
 
         observation += f"""
 SELF-REFLECTION:
 As Codex, I'm finding patterns in my own code that I should fix. This is exactly the dogfooding experience we need - I can see what patterns matter and how to improve detection.
+{cache_hits} of those {files_scanned} files were unchanged since an earlier scan, so I reused what I found last time.
 
 FILES WITH MOST ISSUES:
 """
 
-        # Group by file
-        by_file = {}
-        for v in violations:
-            file = v["file"]
-            if file not in by_file:
-                by_file[file] = []
-            by_file[file].append(v)
-
-        for file, file_violations in sorted(by_file.items(), key=lambda x: len(x[1]), reverse=True)[:5]:
+        for file, file_violations in heapq.nlargest(5, by_file.items(), key=lambda x: len(x[1])):
             observation += f"- {Path(file).name}: {len(file_violations)} issues\n"
 
-        # Store in database
-        with sqlite3.connect(self.db_path) as conn:
-            # Create conversation table if it doesn't exist
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS codex_conversations (
-                    id INTEGER PRIMARY KEY,
-                    timestamp TEXT,
-                    observation_type TEXT,
-                    narrative TEXT,
-                    metadata TEXT
-                )
-            """)
-
-            conn.execute(
-                """
-                INSERT INTO codex_conversations (timestamp, observation_type, narrative, metadata)
-                VALUES (?, ?, ?, ?)
-            """,
-                (
-                    timestamp,
-                    "self_scan",
-                    observation,
-                    json.dumps(
-                        {
-                            "files_scanned": files_scanned,
-                            "total_violations": len(violations),
-                            "patterns_used": len(patterns),
-                            "violation_summary": by_pattern,
-                        }
-                    ),
+        rows = [
+            (
+                timestamp,
+                "self_scan",
+                observation,
+                dumps(
+                    {
+                        "files_scanned": files_scanned,
+                        "total_violations": len(violations),
+                        "patterns_used": len(patterns),
+                        "violation_summary": by_pattern,
+                    }
                 ),
-            )
+            ),
+        ]
+
+        # Staged in the session database; written to disk when the session is flushed
+        self.session.stage(rows)
 
         print("\nStored conversational observation in database")
 
+    def flush_session(self) -> None:
+        """Write the session's conversation rows to the on-disk database in one transaction."""
+        self.session.flush()
+
     def show_summary(self, files_scanned: int, violations: list[dict]) -> None:
         """Show human-readable summary."""
         print("\n=== CODEX SELF-SCAN SUMMARY ===")
@@ -239,6 +471,7 @@ def main():
 
     scanner = SimpleScanner(db_path)
     scanner.scan_directory(codex_dir)
+    scanner.flush_session()
 
 
 if __name__ == "__main__":
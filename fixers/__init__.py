@@ -7,6 +7,7 @@ Each fixer does one thing well and can be combined with others.
 
 from .external_tools_fixer import ExternalToolsFixer
 from .fixer_orchestrator import FixerOrchestrator
+from .fused_pattern_fixer import FusedPatternFixer
 from .hardcoded_paths_fixer import HardcodedPathsFixer
 from .import_consolidation_fixer import ImportConsolidationFixer
 from .print_to_logging_fixer import PrintToLoggingFixer
@@ -14,6 +15,7 @@ from .print_to_logging_fixer import PrintToLoggingFixer
 __all__ = [
     "ExternalToolsFixer",
     "FixerOrchestrator",
+    "FusedPatternFixer",
     "HardcodedPathsFixer",
     "ImportConsolidationFixer",
     "PrintToLoggingFixer",
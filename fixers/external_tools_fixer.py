@@ -6,6 +6,7 @@ Small, focused fixer that handles external tool execution only.
 """
 
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -20,11 +21,16 @@ class ExternalToolsFixer:
         self.target_dir = target_dir
         self.results = {}
 
+        # Resolve the tools once; an unresolved name is kept so running it still fails
+        # with FileNotFoundError as before
+        self._ruff = shutil.which("ruff") or "ruff"
+        self._typos = shutil.which("typos") or "typos"
+
     def fix_with_ruff(self, select_rules: list[str] = None) -> dict[str, Any]:
         """Run ruff with fixes."""
         logger.info("Running ruff with fixes...")
 
-        cmd = ["ruff", "check", str(self.target_dir), "--fix"]
+        cmd = [self._ruff, "check", str(self.target_dir), "--fix"]
 
         if select_rules:
             cmd.extend(["--select", ",".join(select_rules)])
@@ -49,10 +55,13 @@ class ExternalToolsFixer:
 
         try:
             result = subprocess.run(
-                ["typos", str(self.target_dir), "--write-changes"], capture_output=True, text=True, timeout=30
+                [self._typos, str(self.target_dir), "--write-changes"], capture_output=True, text=True, timeout=30
             )
 
-            typo_count = len(result.stdout.splitlines()) if result.stdout else 0
+            # One line per typo, counted without building the list of lines; a last line
+            # without a newline still counts
+            stdout = result.stdout
+            typo_count = stdout.count("\n") + (not stdout.endswith("\n")) if stdout else 0
 
             return {
                 "success": result.returncode == 0,
@@ -7,12 +7,16 @@ Unix philosophy of "do one thing well" and composability.
 """
 
 import logging
+import os
 import shutil
+import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from external_tools_fixer import ExternalToolsFixer
+from fixer_utils import CleanFileCache, iter_py_files
+from fused_pattern_fixer import FusedPatternFixer
 from hardcoded_paths_fixer import HardcodedPathsFixer
 from import_consolidation_fixer import ImportConsolidationFixer
 from print_to_logging_fixer import PrintToLoggingFixer
@@ -20,12 +24,35 @@ from print_to_logging_fixer import PrintToLoggingFixer
 logger = logging.getLogger(__name__)
 
 
+def _clone_file(src: str, dst: str) -> str:
+    """Copy a file like shutil.copy2, letting the kernel clone it where it can.
+
+    os.copy_file_range copies inside the kernel, and on copy-on-write filesystems
+    (btrfs, xfs) shares the extents instead of copying bytes. Anything it cannot
+    handle falls back to a regular copy.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return dst
+
+    return shutil.copy2(src, dst)
+
+
 class FixerOrchestrator:
     """Orchestrates multiple small, modular fixers."""
 
     def __init__(self, target_dir: Path):
         self.target_dir = target_dir
-        self.backup_dir = None
+        # A backup is either a copy of the tree (backup_dir) or a git ref (backup_ref)
+        self.backup_dir: Path | None = None
+        self.backup_ref: str | None = None
         self.results = {}
 
         # Initialize all fixers
@@ -36,16 +63,81 @@ class FixerOrchestrator:
             "import_consolidation": ImportConsolidationFixer(target_dir),
         }
 
-    def create_backup(self) -> Path:
-        """Create backup before applying fixes."""
+    def create_backup(self) -> Path | None:
+        """Create backup before applying fixes.
+
+        Inside a git work tree with nothing untracked the backup is a commit kept under
+        refs/codex-backups/, stored in backup_ref and restored with
+        git checkout <ref> -- <target_dir>. Otherwise the tree is copied next to
+        target_dir and the copy is stored in backup_dir. Returns backup_dir, which is
+        None for a git backup.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"codex_backup_{timestamp}"
+
+        self.backup_ref = self._git_snapshot(backup_name)
+        if self.backup_ref:
+            self.backup_dir = None
+            logger.info(f"Creating backup: {self.backup_ref}")
+            return None
+
         self.backup_dir = self.target_dir.parent / backup_name
 
         logger.info(f"Creating backup: {self.backup_dir}")
-        shutil.copytree(self.target_dir, self.backup_dir)
+        shutil.copytree(self.target_dir, self.backup_dir, copy_function=_clone_file)
         return self.backup_dir
 
+    def _git_snapshot(self, backup_name: str) -> str | None:
+        """Record target_dir's current state as a git commit, leaving the tree as is.
+
+        Returns the ref the commit is kept under, or None if git cannot back up
+        everything the fixers may change: target_dir is not in a work tree, holds
+        untracked files (typos and ruff rewrite more than .py files), or has .py files
+        git ignores.
+        """
+        git = shutil.which("git")
+        if git is None:
+            return None
+
+        def run_git(*args: str) -> subprocess.CompletedProcess:
+            return subprocess.run([git, "-C", str(self.target_dir), *args], capture_output=True, text=True, timeout=60)
+
+        try:
+            # A commit does not record untracked files, so any of them means copying
+            status = run_git("status", "--porcelain", "--untracked-files=all", "--", ".")
+            if status.returncode != 0 or any(line.startswith("??") for line in status.stdout.splitlines()):
+                return None
+
+            # Ignored .py files are not listed as untracked but are still fixed
+            tracked = run_git("ls-files", "-z")
+            if tracked.returncode != 0:
+                return None
+
+            tracked_files = set(tracked.stdout.split("\0"))
+            if any(
+                py_file.relative_to(self.target_dir).as_posix() not in tracked_files
+                for py_file in iter_py_files(self.target_dir)
+            ):
+                return None
+
+            # stash create leaves the working tree alone and prints nothing when there are
+            # no local changes, in which case HEAD already is the backup
+            commit = run_git("stash", "create", backup_name).stdout.strip()
+            if not commit:
+                head = run_git("rev-parse", "--verify", "HEAD")
+                if head.returncode != 0:
+                    return None
+                commit = head.stdout.strip()
+
+            # Kept under a dedicated ref rather than in the user's stash list, named after
+            # the commit too so backups taken within the same second do not replace each other
+            ref = f"refs/codex-backups/{backup_name}_{commit[:12]}"
+            stored = run_git("update-ref", ref, commit)
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        return ref if stored.returncode == 0 else None
+
     def run_fixer(self, fixer_name: str, fixer_instance) -> dict[str, Any]:
         """Run a single fixer and capture results."""
         logger.info(f"Running {fixer_name} fixer...")
@@ -63,9 +155,56 @@ class FixerOrchestrator:
             return {"success": True, "result": result, "summary": summary, "fixer_type": fixer_name}
 
         except Exception as e:
-            logger.error(f"Error in {fixer_name} fixer: {e}")
+            logger.exception(f"Error in {fixer_name} fixer")
             return {"success": False, "error": str(e), "fixer_type": fixer_name}
 
+    def run_pattern_fixers(self, fixer_names: list[str]) -> None:
+        """Run consecutive pattern-based fixers in one parallel pass over the files.
+
+        Each file is handed to one worker, which reads it once, applies every fixer to it
+        in order and writes it once, so the result is the same as running the fixers one
+        after another over the tree. Files every fixer found clean on an earlier run are
+        skipped while they stay unchanged.
+        """
+        logger.info(f"Running {', '.join(fixer_names)} fixers...")
+        fixers = [self.fixers[fixer_name] for fixer_name in fixer_names]
+
+        try:
+            py_files = list(iter_py_files(self.target_dir))
+            cache = CleanFileCache(self.target_dir)
+            per_file = cache.fix_files(FusedPatternFixer(fixers), py_files)
+            cache.save()
+        except Exception as e:
+            logger.exception(f"Error in {', '.join(fixer_names)} fixers")
+            for fixer_name in fixer_names:
+                self.results[fixer_name] = {"success": False, "error": str(e), "fixer_type": fixer_name}
+            return
+
+        for i, (fixer_name, fixer_instance) in enumerate(zip(fixer_names, fixers, strict=True)):
+            result = fixer_instance.record_results(py_files, [results[i] for results in per_file])
+            summary = fixer_instance.get_summary()
+            self.results[fixer_name] = {
+                "success": True,
+                "result": result,
+                "summary": summary,
+                "fixer_type": fixer_name,
+            }
+
+    def run_in_order(self, fixer_names: list[str]) -> None:
+        """Run fixers in the given order, batching consecutive pattern-based fixers."""
+        batch = []
+        for fixer_name in [*fixer_names, None]:
+            fixer_instance = self.fixers.get(fixer_name)
+            if fixer_instance is not None and not hasattr(fixer_instance, "run_all_tools"):
+                batch.append(fixer_name)
+                continue
+
+            if batch:
+                self.run_pattern_fixers(batch)
+                batch = []
+            if fixer_instance is not None:
+                self.results[fixer_name] = self.run_fixer(fixer_name, fixer_instance)
+
     def run_all_fixers(self, skip_external: bool = False) -> dict[str, Any]:
         """Run all fixers in sequence."""
         logger.info("Starting orchestrated fixing session...")
@@ -74,14 +213,14 @@ class FixerOrchestrator:
         self.create_backup()
 
         # Run fixers in order
-        for fixer_name, fixer_instance in self.fixers.items():
+        fixer_names = []
+        for fixer_name in self.fixers:
             if skip_external and fixer_name == "external_tools":
                 logger.info(f"Skipping {fixer_name} (skip_external=True)")
                 continue
+            fixer_names.append(fixer_name)
 
-            result = self.run_fixer(fixer_name, fixer_instance)
-            self.results[fixer_name] = result
-
+        self.run_in_order(fixer_names)
         return self.results
 
     def run_selected_fixers(self, selected: list[str]) -> dict[str, Any]:
@@ -92,13 +231,14 @@ class FixerOrchestrator:
         self.create_backup()
 
         # Run selected fixers
+        fixer_names = []
         for fixer_name in selected:
             if fixer_name in self.fixers:
-                result = self.run_fixer(fixer_name, self.fixers[fixer_name])
-                self.results[fixer_name] = result
+                fixer_names.append(fixer_name)
             else:
                 logger.warning(f"Unknown fixer: {fixer_name}")
 
+        self.run_in_order(fixer_names)
         return self.results
 
     def get_overall_summary(self) -> dict[str, Any]:
@@ -120,7 +260,7 @@ class FixerOrchestrator:
             "successful_fixers": successful_fixers,
             "failed_fixers": failed_fixers,
             "total_fixes_applied": total_fixes,
-            "backup_location": str(self.backup_dir) if self.backup_dir else None,
+            "backup_location": str(self.backup_dir) if self.backup_dir else self.backup_ref,
         }
 
     def create_session_report(self) -> str:
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Fixer Utilities - Shared plumbing for the pattern-based fixers.
+
+Small helpers only; each fixer keeps its own fixing logic.
+"""
+
+import ast
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import re
+import stat
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Files this large are searched for triggers through a read-only mmap before being read
+_MMAP_THRESHOLD = 1 << 20
+
+# Directories pruned from the walk instead of being descended into and filtered out
+SKIP_DIRS = frozenset({"__pycache__", ".venv", ".git"})
+_SKIP_DIR_PREFIXES = ("backup_",)
+
+
+def iter_py_files(
+    root: str | Path, skip_dirs: frozenset[str] = SKIP_DIRS, skip_prefixes: tuple[str, ...] = _SKIP_DIR_PREFIXES
+) -> Iterator[Path]:
+    """Yield the .py files under root, files of a directory before its subdirectories.
+
+    Directories named in skip_dirs or starting with one of skip_prefixes are not walked.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs and not entry.name.startswith(skip_prefixes):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    files.append(Path(entry.path))
+    except OSError:
+        return
+
+    yield from files
+    for subdir in subdirs:
+        yield from iter_py_files(subdir, skip_dirs, skip_prefixes)
+
+
+def read_source_if_contains(file_path: Path, triggers: Iterable[bytes]) -> str | None:
+    """Read a file as text, or return None if its bytes contain none of triggers.
+
+    Files that cannot need a fix are ruled out before decoding. Decoding errors propagate
+    as from a text-mode read, and newlines get the same universal-newline translation.
+    """
+    raw = read_bytes_if_contains(file_path, triggers)
+    if raw is None:
+        return None
+
+    return decode_source(raw)
+
+
+def read_bytes_if_contains(file_path: Path, triggers: Iterable[bytes]) -> bytes | None:
+    """Read a file's bytes, or return None if they contain none of triggers.
+
+    Large files are searched in place through a read-only mmap, so one that cannot need
+    a fix is never copied into memory.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            raw = f.read()
+            return raw if any(trigger in raw for trigger in triggers) else None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not any(mm.find(trigger) != -1 for trigger in triggers):
+                return None
+        return f.read()
+
+
+def decode_source(raw: bytes) -> str:
+    """Decode a source file's bytes as a text-mode read would, newlines included."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def atomic_write(file_path: Path, content: str) -> None:
+    """Replace a file's content with content, UTF-8 encoded, atomically.
+
+    The data goes to a temp file beside the real file that is then renamed over it, so a
+    crash mid-write never leaves a truncated file. Symlinks are written through, and the
+    file's permissions and (where allowed) ownership are kept. A file with several hard
+    links is rewritten in place instead, since renaming over it would detach its other
+    names.
+    """
+    data = content.encode("utf-8")
+    target = os.path.realpath(file_path)
+    st = os.stat(target)
+
+    if st.st_nlink > 1:
+        with open(target, "wb") as f:
+            f.write(data)
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            os.fchmod(f.fileno(), stat.S_IMODE(st.st_mode))
+            # Only root can give a file away; otherwise the temp file stays ours
+            with contextlib.suppress(PermissionError):
+                os.fchown(f.fileno(), st.st_uid, st.st_gid)
+        os.replace(tmp_path, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+# Fixer used by worker processes, set once per worker by _init_worker
+_worker_fixer = None
+
+
+def _init_worker(fixer) -> None:
+    global _worker_fixer
+    _worker_fixer = fixer
+
+
+def _fix_one(file_path: Path) -> Any:
+    return _worker_fixer.fix_file(file_path)
+
+
+def fix_files(fixer, files: Iterable[Path]) -> list[Any]:
+    """Run fixer.fix_file over files in worker processes, returning results in file order.
+
+    Files are fixed independently, so each one is handled by exactly one worker (the pool
+    hands out disjoint chunks) and no two workers ever write the same file; the fixer
+    (with its replacement tables) is sent to each worker once.
+    """
+    files = list(files)
+    if not files:
+        return []
+
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(fixer,)) as executor:
+        return list(executor.map(_fix_one, files, chunksize=32))
+
+
+def _clean_cache_path(target_dir: Path) -> Path:
+    """Where the fixers' clean files for target_dir are remembered between runs.
+
+    The cache lives under the XDG cache directory, keyed by the resolved target path, so
+    nothing is ever written into the tree being fixed.
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    key = hashlib.blake2b(str(Path(target_dir).resolve()).encode(), digest_size=16).hexdigest()
+    return cache_home / "codex" / "fixer_cache" / f"{key}.json"
+
+
+def _fixer_digest(fixer) -> str:
+    """Fingerprint a fixer's code so files it found clean are rechecked when it changes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_file in (sys.modules[type(fixer).__module__].__file__, __file__):
+        digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+class CleanFileCache:
+    """Files each pattern fixer last found nothing to fix in, persisted across runs.
+
+    A file is identified by its path relative to the target directory, modification time
+    and size, so any change to it makes the fixers look at it again.
+    """
+
+    def __init__(self, target_dir: Path):
+        self.target_dir = Path(target_dir)
+        self.cache_path = _clean_cache_path(self.target_dir)
+
+        try:
+            self._fixers = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._fixers = {}
+
+    def _clean_files(self, fixer) -> dict[str, list[int]]:
+        """The files fixer found clean last time, or none if its code has changed."""
+        entry = self._fixers.get(type(fixer).__name__)
+        if not isinstance(entry, dict) or entry.get("digest") != _fixer_digest(fixer):
+            return {}
+        return entry.get("files", {})
+
+    def _stamp(self, file_path: Path) -> tuple[str, list[int]] | None:
+        """A file's relative path and [mtime_ns, size], or None if it cannot be stat'ed."""
+        try:
+            st = file_path.stat()
+            return file_path.relative_to(self.target_dir).as_posix(), [st.st_mtime_ns, st.st_size]
+        except (OSError, ValueError):
+            return None
+
+    def fix_files(self, fixer, files: Iterable[Path]) -> list[Any]:
+        """fix_files, skipping the files that are unchanged since fixer found them clean.
+
+        fixer is a pattern fixer or a FusedPatternFixer, whose per-fixer results are each
+        remembered for the fixer they come from; a file is skipped only if every one of
+        them found it clean. Skipped files get the same result as a clean fix_file.
+        """
+        files = list(files)
+        fused = hasattr(fixer, "fixers")
+        members = fixer.fixers if fused else [fixer]
+        cached = [self._clean_files(member) for member in members]
+
+        stamps = [self._stamp(file_path) for file_path in files]
+        skipped = [
+            stamp is not None and all(member_files.get(stamp[0]) == stamp[1] for member_files in cached)
+            for stamp in stamps
+        ]
+        fixed = iter(fix_files(fixer, [file_path for file_path, skip in zip(files, skipped, strict=True) if not skip]))
+
+        clean = [{} for _ in members]
+        results = []
+        for stamp, skip in zip(stamps, skipped, strict=True):
+            if skip:
+                per_member = [{"success": True, "fixes_applied": 0, "details": []} for _ in members]
+            else:
+                result = next(fixed)
+                per_member = result if fused else [result]
+            results.append(per_member if fused else per_member[0])
+
+            # Stamps are taken before fixing, so a file that gets rewritten never matches
+            if stamp is not None:
+                for member_clean, member_result in zip(clean, per_member, strict=True):
+                    if member_result["success"] and not member_result["fixes_applied"]:
+                        member_clean[stamp[0]] = stamp[1]
+
+        for member, member_clean in zip(members, clean, strict=True):
+            self._fixers[type(member).__name__] = {"digest": _fixer_digest(member), "files": member_clean}
+        return results
+
+    def save(self) -> None:
+        """Write the cache back for the next run."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(self._fixers), encoding="utf-8")
+        except OSError:
+            # The cache only saves work, so a run that cannot keep it has still succeeded
+            pass
+
+
+def import_insertion_line(tree: ast.Module) -> int:
+    """Return how many lines of a parsed module go above a new top-level import.
+
+    The import goes after the last top-level import, or with none after the module
+    docstring, or with neither before the first statement (and its decorators). It never
+    lands inside a statement: a multi-line import or docstring is passed as a whole, as
+    are statements sharing its last line after a semicolon.
+    """
+    body = tree.body
+    anchor = None
+    for index, node in enumerate(body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            anchor = index
+    if anchor is None and body and isinstance(body[0], ast.Expr):
+        docstring = body[0].value
+        if isinstance(docstring, ast.Constant) and isinstance(docstring.value, str):
+            anchor = 0
+
+    if anchor is None:
+        if not body:
+            return 0
+        first = body[0]
+        return min([first.lineno, *(d.lineno for d in getattr(first, "decorator_list", ()))]) - 1
+
+    line = body[anchor].end_lineno
+    for node in body[anchor + 1 :]:
+        if node.lineno > line:
+            break
+        line = node.end_lineno
+    return line
+
+
+def insert_import(content: str, tree: ast.Module, new_line: str) -> str:
+    """Insert new_line into content where import_insertion_line places it; tree is content parsed."""
+    offset = 0
+    for _ in range(import_insertion_line(tree)):
+        line_end = content.find("\n", offset)
+        if line_end == -1:
+            return content + "\n" + new_line
+        offset = line_end + 1
+    return content[:offset] + new_line + "\n" + content[offset:]
+
+
+def insert_after_imports(content: str, import_re: re.Pattern, new_line: str) -> str:
+    """Insert new_line after the last line that import_re matches at the start of.
+
+    With no such line it goes after the first line. Only for content that does not
+    parse: a match can sit inside a multi-line statement or string, which
+    insert_import rules out.
+    """
+    last_import = 0
+    for match in import_re.finditer(content):
+        last_import = match.start()
+
+    line_end = content.find("\n", last_import)
+    if line_end == -1:
+        return content + "\n" + new_line
+    return content[: line_end + 1] + new_line + "\n" + content[line_end + 1 :]
+
+
+def keyword_automaton(keywords: Iterable[str]):
+    """Build an Aho-Corasick automaton over keywords, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def rewrite_matching_lines(
+    content: str, candidate_re: re.Pattern, rewrite: Callable[[str], str], automaton=None
+) -> tuple[str, list[tuple[int, str, str]]]:
+    """Apply rewrite to each line of content that candidate_re matches within.
+
+    Only candidate lines are sliced out and the result is spliced together once, instead
+    of splitting the whole file into lines and joining it back. candidate_re must not
+    match across a newline. Returns the new content and (line_num, old, new) for every
+    line that changed.
+
+    If automaton (from keyword_automaton) is given, candidate lines are instead those
+    containing one of its keywords, all found in a single pass; the keywords must not
+    contain a newline, and must cover every line rewrite would change.
+    """
+    pieces = []
+    changes = []
+    pos = 0
+    copied_to = 0
+    line_num = 1
+    counted_to = 0
+    hits = None if automaton is None else automaton.iter(content)
+
+    while True:
+        if hits is None:
+            match = candidate_re.search(content, pos)
+            if match is None:
+                break
+            hit = match.start()
+        else:
+            # Keyword end offsets come in order; skip those on lines already handled
+            hit = next((end for end, _ in hits if end >= pos), None)
+            if hit is None:
+                break
+
+        line_start = content.rfind("\n", 0, hit) + 1
+        line_end = content.find("\n", hit)
+        if line_end == -1:
+            line_end = len(content)
+        pos = line_end + 1
+
+        line = content[line_start:line_end]
+        new_line = rewrite(line)
+        if new_line == line:
+            continue
+
+        line_num += content.count("\n", counted_to, line_start)
+        counted_to = line_start
+        pieces.append(content[copied_to:line_start])
+        pieces.append(new_line)
+        copied_to = line_end
+        changes.append((line_num, line, new_line))
+
+    if not changes:
+        return content, changes
+
+    pieces.append(content[copied_to:])
+    return "".join(pieces), changes
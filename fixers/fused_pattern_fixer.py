@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Fused Pattern Fixer - Applies several pattern-based fixers in one pass per file.
+
+Small composition fixer: each file is read and decoded once, handed through every
+fixer's fix_content in order, and written back once.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from fixer_utils import atomic_write, decode_source, read_bytes_if_contains
+
+logger = logging.getLogger(__name__)
+
+
+def _no_fixes() -> dict[str, Any]:
+    """A fresh result for a fixer that had nothing to change in a file."""
+    return {"success": True, "fixes_applied": 0, "details": []}
+
+
+class FusedPatternFixer:
+    """Runs pattern-based fixers over each file in a single read/write pass."""
+
+    def __init__(self, fixers: list):
+        self.fixers = fixers
+
+        # A file none of the fixers has a trigger in is skipped before decoding
+        self.triggers = tuple(trigger for fixer in fixers for trigger in fixer.triggers)
+
+        # A fixer is applied only when its triggers are present, checked against the
+        # content as left by the fixers before it, just as if each re-read the file
+        self._text_triggers = [tuple(trigger.decode("ascii") for trigger in fixer.triggers) for fixer in fixers]
+
+    def fix_file(self, file_path: Path) -> list[dict[str, Any]]:
+        """Fix a single file with every fixer in order, returning one result per fixer."""
+        try:
+            raw = read_bytes_if_contains(file_path, self.triggers)
+        except OSError as e:
+            logger.exception(f"Error processing {file_path}")
+            return [{"success": False, "error": str(e), "fixes_applied": 0} for _ in self.fixers]
+
+        if raw is None:
+            return [_no_fixes() for _ in self.fixers]
+
+        try:
+            content = decode_source(raw)
+        except UnicodeDecodeError as e:
+            # Only the fixers that would have decoded the file report the failure
+            logger.exception(f"Error processing {file_path}")
+            return [
+                {"success": False, "error": str(e), "fixes_applied": 0}
+                if any(t in raw for t in fixer.triggers)
+                else _no_fixes()
+                for fixer in self.fixers
+            ]
+
+        results = []
+        for fixer, triggers in zip(self.fixers, self._text_triggers, strict=True):
+            if not any(trigger in content for trigger in triggers):
+                results.append(_no_fixes())
+                continue
+
+            content, file_fixes = fixer.fix_content(content)
+            results.append({"success": True, "fixes_applied": len(file_fixes), "details": file_fixes})
+
+        if any(result["fixes_applied"] for result in results):
+            try:
+                atomic_write(file_path, content)
+            except OSError as e:
+                # Nothing was written, so the fixers that had changes report the failure
+                logger.exception(f"Error processing {file_path}")
+                return [
+                    {"success": False, "error": str(e), "fixes_applied": 0} if result["fixes_applied"] else result
+                    for result in results
+                ]
+
+        return results
@@ -5,103 +5,129 @@ Hardcoded Paths Fixer - Replaces hardcoded paths with settings references.
 Small, focused fixer that handles hardcoded path replacement only.
 """
 
+import ast
 import logging
 import re
 from pathlib import Path
 from typing import Any
 
+from fixer_utils import (
+    CleanFileCache,
+    atomic_write,
+    insert_after_imports,
+    insert_import,
+    iter_py_files,
+    keyword_automaton,
+    read_source_if_contains,
+    rewrite_matching_lines,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class HardcodedPathsFixer:
     """Replaces hardcoded paths with settings references."""
 
+    # Literal parts every path pattern needs ("patterns" for the database files, "/codex"
+    # for the directories), so files without them are skipped undecoded
+    triggers = (b"patterns", b"/codex")
+
+    # An existing settings import, in one scan of the file
+    _SETTINGS_IMPORT_RE = re.compile(r"^\s*from (?:\.|codex\.)settings import settings", re.MULTILINE)
+
+    # Import lines, to place a new import after the last of them in content that does not parse
+    _IMPORT_LINE_RE = re.compile(r"^(?:import |from )", re.MULTILINE)
+
+    # Path replacement patterns, compiled once per process rather than per instance
+    path_replacements = {
+        r'["\']patterns\.db["\']': "settings.database_path",
+        r'["\']patterns_fts\.db["\']': "settings.database_path",
+        r'["\']~/.config/codex["\']': "settings.config_dir",
+        r'["\']~/.local/share/codex["\']': "settings.data_dir",
+        r'["\']~/.cache/codex["\']': "settings.cache_dir",
+    }
+    _compiled_replacements = tuple(
+        (re.compile(pattern), replacement) for pattern, replacement in path_replacements.items()
+    )
+
+    # One alternation of all of them, so a line without any hardcoded path costs a single search
+    _combined = re.compile("|".join(f"(?:{pattern})" for pattern in path_replacements))
+
+    # Literal text every match of a path pattern contains, so one Aho-Corasick pass (when
+    # pyahocorasick is installed) finds the candidate lines; the patterns still decide
+    _keywords = ("patterns.db", "patterns_fts.db", "config/codex", "local/share/codex", "cache/codex")
+    _automaton = keyword_automaton(_keywords)
+
+    # Whether any replacement refers to settings is fixed by the table above
+    _uses_settings = any(replacement.startswith("settings.") for replacement in path_replacements.values())
+
     def __init__(self, target_dir: Path):
         self.target_dir = target_dir
         self.fixes_applied = []
 
-        # Define path replacement patterns
-        self.path_replacements = {
-            r'["\']patterns\.db["\']': "settings.database_path",
-            r'["\']patterns_fts\.db["\']': "settings.database_path",
-            r'["\']~/.config/codex["\']': "settings.config_dir",
-            r'["\']~/.local/share/codex["\']': "settings.data_dir",
-            r'["\']~/.cache/codex["\']': "settings.cache_dir",
-        }
-
     def needs_settings_import(self, content: str) -> bool:
         """Check if file needs settings import."""
-        uses_settings = any(replacement.startswith("settings.") for replacement in self.path_replacements.values())
-        has_settings = any(
-            line in content for line in ["from .settings import settings", "from codex.settings import settings"]
-        )
-        return uses_settings and not has_settings
+        if not self._uses_settings:
+            return False
 
-    def add_settings_import(self, lines: list[str]) -> list[str]:
-        """Add settings import to file."""
-        # Find good spot for import (after other imports)
-        import_line = 0
-        for i, line in enumerate(lines):
-            if line.startswith(("import ", "from ")):
-                import_line = i
+        return not self._SETTINGS_IMPORT_RE.search(content)
 
-        lines.insert(import_line + 1, "from .settings import settings")
-        return lines
+    def add_settings_import(self, content: str) -> str:
+        """Add settings import to file."""
+        # Good spot for import is after other imports, at a statement boundary of the tree
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return insert_after_imports(content, self._IMPORT_LINE_RE, "from .settings import settings")
+        return insert_import(content, tree, "from .settings import settings")
 
     def apply_path_replacements(self, line: str) -> str:
         """Apply path replacements to a line."""
-        original_line = line
+        if not self._combined.search(line):
+            return line
 
-        for pattern, replacement in self.path_replacements.items():
-            if re.search(pattern, line):
-                line = re.sub(pattern, replacement, line)
+        # Replacements can share a quote character, so apply them in order as before
+        # rather than in one simultaneous substitution
+        for pattern, replacement in self._compiled_replacements:
+            line = pattern.sub(replacement, line)
 
         return line
 
+    def _fix_line(self, line: str) -> str:
+        """Apply path replacements to a line unless it is a comment."""
+        # Skip comments
+        if line.strip().startswith("#"):
+            return line
+        return self.apply_path_replacements(line)
+
+    def fix_content(self, content: str) -> tuple[str, list[dict[str, Any]]]:
+        """Fix hardcoded paths in a file's content, returning the new content and fixes."""
+        # Apply path replacements, visiting only lines that contain a hardcoded path
+        new_content, changes = rewrite_matching_lines(content, self._combined, self._fix_line, self._automaton)
+        file_fixes = [
+            {"type": "path_replaced", "line_num": line_num, "old": old.strip(), "new": new.strip()}
+            for line_num, old, new in changes
+        ]
+
+        # Add settings import if needed
+        if changes and self.needs_settings_import(content):
+            new_content = self.add_settings_import(new_content)
+            file_fixes.append({"type": "import_added", "description": "Added settings import"})
+
+        return new_content, file_fixes
+
     def fix_file(self, file_path: Path) -> dict[str, Any]:
         """Fix hardcoded paths in a single file."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            lines = content.split("\n")
-            modified = False
-            file_fixes = []
-            needs_settings = False
-
-            # Apply path replacements
-            for i, line in enumerate(lines):
-                # Skip comments
-                if line.strip().startswith("#"):
-                    continue
-
-                original_line = line
-                new_line = self.apply_path_replacements(line)
-
-                if new_line != original_line:
-                    lines[i] = new_line
-                    modified = True
-                    needs_settings = True
-                    file_fixes.append(
-                        {
-                            "type": "path_replaced",
-                            "line_num": i + 1,
-                            "old": original_line.strip(),
-                            "new": new_line.strip(),
-                        }
-                    )
-
-            # Add settings import if needed
-            if needs_settings and self.needs_settings_import(content):
-                lines = self.add_settings_import(lines)
-                modified = True
-                file_fixes.append({"type": "import_added", "description": "Added settings import"})
+            content = read_source_if_contains(file_path, self.triggers)
+            if content is None:
+                return {"success": True, "fixes_applied": 0, "details": []}
+
+            content, file_fixes = self.fix_content(content)
 
             # Write back if modified
-            if modified:
-                content = "\n".join(lines)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            if file_fixes:
+                atomic_write(file_path, content)
 
                 return {"success": True, "fixes_applied": len(file_fixes), "details": file_fixes}
             else:
@@ -115,16 +141,23 @@ class HardcodedPathsFixer:
         """Fix hardcoded paths in all Python files."""
         logger.info("Replacing hardcoded paths with settings...")
 
+        # Unwanted directories are pruned by the walk
+        py_files = list(iter_py_files(self.target_dir))
+
+        # Files are independent, so fix them in parallel and reduce the results here;
+        # files unchanged since a run that found them clean are skipped
+        cache = CleanFileCache(self.target_dir)
+        results = cache.fix_files(self, py_files)
+        cache.save()
+        return self.record_results(py_files, results)
+
+    def record_results(self, py_files: list[Path], results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Reduce per-file fix_file results into directory totals and fixes_applied."""
         files_processed = 0
         total_fixes = 0
         file_results = {}
 
-        for py_file in self.target_dir.rglob("*.py"):
-            # Skip unwanted directories
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv", ".git", "backup_"]):
-                continue
-
-            result = self.fix_file(py_file)
+        for py_file, result in zip(py_files, results, strict=True):
             file_results[str(py_file)] = result
 
             if result["success"]:
@@ -6,27 +6,46 @@ Small, focused fixer that handles import consolidation only.
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
+from fixer_utils import (
+    CleanFileCache,
+    atomic_write,
+    iter_py_files,
+    keyword_automaton,
+    read_source_if_contains,
+    rewrite_matching_lines,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class ImportConsolidationFixer:
     """Consolidates deprecated imports to unified modules."""
 
+    # Every deprecated import names one of these, so files without them are skipped undecoded
+    triggers = (b"database import", b"import database", b"import fts_database")
+
+    # Deprecated import replacements, shared by every instance
+    deprecated_imports = {
+        "from .database import": "from .unified_database import UnifiedDatabase",
+        "from .fts_database import": "from .unified_database import UnifiedDatabase",
+        "import database": "from .unified_database import UnifiedDatabase",
+        "import fts_database": "from .unified_database import UnifiedDatabase",
+    }
+
+    # Any deprecated import, to find the lines worth rewriting in one search
+    _deprecated_re = re.compile("|".join(map(re.escape, deprecated_imports)))
+
+    # The same search as one Aho-Corasick pass, when pyahocorasick is installed
+    _automaton = keyword_automaton(deprecated_imports)
+
     def __init__(self, target_dir: Path):
         self.target_dir = target_dir
         self.fixes_applied = []
 
-        # Define deprecated import replacements
-        self.deprecated_imports = {
-            "from .database import": "from .unified_database import UnifiedDatabase",
-            "from .fts_database import": "from .unified_database import UnifiedDatabase",
-            "import database": "from .unified_database import UnifiedDatabase",
-            "import fts_database": "from .unified_database import UnifiedDatabase",
-        }
-
     def replace_deprecated_imports(self, line: str) -> str:
         """Replace deprecated imports in a line."""
         original_line = line
@@ -38,38 +57,30 @@ class ImportConsolidationFixer:
 
         return line
 
+    def fix_content(self, content: str) -> tuple[str, list[dict[str, Any]]]:
+        """Fix imports in a file's content, returning the new content and fixes."""
+        # Replace deprecated imports, visiting only lines that contain one
+        content, changes = rewrite_matching_lines(
+            content, self._deprecated_re, self.replace_deprecated_imports, self._automaton
+        )
+        file_fixes = [
+            {"type": "import_replaced", "line_num": line_num, "old": old.strip(), "new": new.strip()}
+            for line_num, old, new in changes
+        ]
+        return content, file_fixes
+
     def fix_file(self, file_path: Path) -> dict[str, Any]:
         """Fix imports in a single file."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            lines = content.split("\n")
-            modified = False
-            file_fixes = []
-
-            # Replace deprecated imports
-            for i, line in enumerate(lines):
-                original_line = line
-                new_line = self.replace_deprecated_imports(line)
-
-                if new_line != original_line:
-                    lines[i] = new_line
-                    modified = True
-                    file_fixes.append(
-                        {
-                            "type": "import_replaced",
-                            "line_num": i + 1,
-                            "old": original_line.strip(),
-                            "new": new_line.strip(),
-                        }
-                    )
+            content = read_source_if_contains(file_path, self.triggers)
+            if content is None:
+                return {"success": True, "fixes_applied": 0, "details": []}
+
+            content, file_fixes = self.fix_content(content)
 
             # Write back if modified
-            if modified:
-                content = "\n".join(lines)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            if file_fixes:
+                atomic_write(file_path, content)
 
                 return {"success": True, "fixes_applied": len(file_fixes), "details": file_fixes}
             else:
@@ -83,16 +94,23 @@ class ImportConsolidationFixer:
         """Fix imports in all Python files."""
         logger.info("Consolidating deprecated imports...")
 
+        # Unwanted directories are pruned by the walk
+        py_files = list(iter_py_files(self.target_dir))
+
+        # Files are independent, so fix them in parallel and reduce the results here;
+        # files unchanged since a run that found them clean are skipped
+        cache = CleanFileCache(self.target_dir)
+        results = cache.fix_files(self, py_files)
+        cache.save()
+        return self.record_results(py_files, results)
+
+    def record_results(self, py_files: list[Path], results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Reduce per-file fix_file results into directory totals and fixes_applied."""
         files_processed = 0
         total_fixes = 0
         file_results = {}
 
-        for py_file in self.target_dir.rglob("*.py"):
-            # Skip unwanted directories
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv", ".git", "backup_"]):
-                continue
-
-            result = self.fix_file(py_file)
+        for py_file, result in zip(py_files, results, strict=True):
             file_results[str(py_file)] = result
 
             if result["success"]:
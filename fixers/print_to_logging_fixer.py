@@ -5,17 +5,46 @@ Print to Logging Fixer - Converts print statements to proper logging calls.
 Small, focused fixer that handles print statement conversion only.
 """
 
+import ast
 import logging
 import re
 from pathlib import Path
 from typing import Any
 
+from fixer_utils import (
+    CleanFileCache,
+    atomic_write,
+    import_insertion_line,
+    insert_after_imports,
+    iter_py_files,
+    read_source_if_contains,
+    rewrite_matching_lines,
+)
+
 logger = logging.getLogger(__name__)
 
+# Lines containing "print(" or "print " (which covers "console.print(") may need converting
+_PRINT_CANDIDATE = re.compile(r"print[( ]")
+
 
 class PrintToLoggingFixer:
     """Converts print statements to logging calls."""
 
+    # A file needs the logging import or a conversion only if it contains one of these
+    # (which covers "console.print("), so files without them are skipped undecoded
+    triggers = (b"print(", b"print ")
+
+    # An existing logging import, in one scan of the file
+    _LOGGING_IMPORT_RE = re.compile(r"^\s*(?:import logging\b|from logging import)", re.MULTILINE)
+
+    # Import lines other than of logging, to place the logging import after the last of them
+    _IMPORT_LINE_RE = re.compile(r"^(?:import |from )(?![^\n]*logging)", re.MULTILINE)
+
+    # Line-based conversions, compiled once rather than looked up in the re cache per line
+    _PRINT_CALL_RE = re.compile(r"print\s*\(")
+    _PRINT_STATEMENT_RE = re.compile(r"print\s+")
+    _CONSOLE_PRINT_RE = re.compile(r"console\.print\s*\(")
+
     def __init__(self, target_dir: Path):
         self.target_dir = target_dir
         self.fixes_applied = []
@@ -23,19 +52,12 @@ class PrintToLoggingFixer:
     def needs_logging_import(self, content: str) -> bool:
         """Check if file needs logging import."""
         has_print = "print(" in content
-        has_logging = any(line in content for line in ["import logging", "from logging import"])
-        return has_print and not has_logging
+        return has_print and not self._LOGGING_IMPORT_RE.search(content)
 
-    def add_logging_import(self, lines: list[str]) -> list[str]:
-        """Add logging import to file."""
-        # Find good spot for import (after other imports)
-        import_line = 0
-        for i, line in enumerate(lines):
-            if line.startswith(("import ", "from ")) and "logging" not in line:
-                import_line = i
-
-        lines.insert(import_line + 1, "import logging")
-        return lines
+    def add_logging_import(self, content: str) -> str:
+        """Add logging import to a file that does not parse (see fix_content)."""
+        # Good spot for import is after other imports
+        return insert_after_imports(content, self._IMPORT_LINE_RE, "import logging")
 
     def should_skip_line(self, line: str) -> bool:
         """Check if line should be skipped."""
@@ -54,62 +76,145 @@ class PrintToLoggingFixer:
 
         # Convert print( to logging.info(
         if "print(" in line:
-            line = re.sub(r"print\s*\(", "logging.info(", line)
+            line = self._PRINT_CALL_RE.sub("logging.info(", line)
 
         # Convert print with space to logging.info
         elif "print " in line and not line.strip().startswith("#"):
-            line = re.sub(r"print\s+", "logging.info(", line)
+            line = self._PRINT_STATEMENT_RE.sub("logging.info(", line)
             if not line.rstrip().endswith(")"):
                 line = line.rstrip() + ")"
 
         # Convert console.print to logging.info
         if "console.print(" in line:
-            line = re.sub(r"console\.print\s*\(", "logging.info(", line)
+            line = self._CONSOLE_PRINT_RE.sub("logging.info(", line)
 
         return line
 
+    def _fix_line(self, line: str) -> str:
+        """Convert the print statements on a line unless it should be skipped."""
+        if self.should_skip_line(line):
+            return line
+        return self.convert_print_to_logging(line)
+
+    def find_print_calls(self, content: str) -> list[tuple[int, int, int]] | None:
+        """Locate the print(...) and console.print(...) calls that can become logging.info.
+
+        Only calls with exactly one positional argument and no keywords qualify: file=,
+        end=, sep= and flush= have no logging counterpart, and several arguments would
+        turn into a %-format call. Returns sorted (line_num, start_col, end_col) spans of
+        the callee to replace, or None if the content does not parse.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return None
+
+        return self._print_calls(tree, content.split("\n"))
+
+    def _print_calls(self, tree: ast.Module, lines: list[str]) -> list[tuple[int, int, int]]:
+        """find_print_calls over an already-parsed tree and the lines it was parsed from."""
+        calls = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or node.keywords or len(node.args) != 1:
+                continue
+            if isinstance(node.args[0], ast.Starred):
+                continue
+
+            func = node.func
+            is_print = isinstance(func, ast.Name) and func.id == "print"
+            is_console_print = (
+                isinstance(func, ast.Attribute)
+                and func.attr == "print"
+                and isinstance(func.value, ast.Name)
+                and func.value.id == "console"
+            )
+            if not (is_print or is_console_print) or func.lineno != func.end_lineno:
+                continue
+
+            # ast columns are UTF-8 byte offsets; the spans are string indices
+            line = lines[func.lineno - 1]
+            start_col, end_col = func.col_offset, func.end_col_offset
+            if not line.isascii():
+                encoded = line.encode("utf-8")
+                start_col = len(encoded[:start_col].decode("utf-8"))
+                end_col = len(encoded[:end_col].decode("utf-8"))
+            calls.append((func.lineno, start_col, end_col))
+
+        calls.sort()
+        return calls
+
+    def fix_content(self, content: str) -> tuple[str, list[dict[str, Any]]]:
+        """Fix print statements in a file's content, returning the new content and fixes."""
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            # Not valid Python; fall back to the per-line heuristics
+            return self._fix_content_by_line(content)
+
+        lines = content.split("\n")
+        calls = self._print_calls(tree, lines)
+        file_fixes = []
+        if not calls:
+            return content, file_fixes
+
+        # Add logging import if needed, at a statement boundary taken from the tree, and
+        # move the calls below it down a line
+        if not self._LOGGING_IMPORT_RE.search(content):
+            insert_at = import_insertion_line(tree)
+            lines.insert(insert_at, "import logging")
+            file_fixes.append({"type": "import_added", "description": "Added logging import"})
+            calls = [(line_num + (line_num > insert_at), start_col, end_col) for line_num, start_col, end_col in calls]
+
+        calls_by_line: dict[int, list[tuple[int, int]]] = {}
+        for line_num, start_col, end_col in calls:
+            calls_by_line.setdefault(line_num, []).append((start_col, end_col))
+
+        for line_num, spans in calls_by_line.items():
+            original_line = line = lines[line_num - 1]
+            for start_col, end_col in reversed(spans):
+                line = line[:start_col] + "logging.info" + line[end_col:]
+            lines[line_num - 1] = line
+            file_fixes.append(
+                {
+                    "type": "print_converted",
+                    "line_num": line_num,
+                    "old": original_line.strip(),
+                    "new": line.strip(),
+                }
+            )
+
+        return "\n".join(lines), file_fixes
+
+    def _fix_content_by_line(self, content: str) -> tuple[str, list[dict[str, Any]]]:
+        """Fix print statements line by line, for content that ast cannot parse."""
+        file_fixes = []
+
+        # Add logging import if needed
+        if self.needs_logging_import(content):
+            content = self.add_logging_import(content)
+            file_fixes.append({"type": "import_added", "description": "Added logging import"})
+
+        # Convert print statements, visiting only lines that mention print
+        content, changes = rewrite_matching_lines(content, _PRINT_CANDIDATE, self._fix_line)
+        file_fixes.extend(
+            {"type": "print_converted", "line_num": line_num, "old": old.strip(), "new": new.strip()}
+            for line_num, old, new in changes
+        )
+
+        return content, file_fixes
+
     def fix_file(self, file_path: Path) -> dict[str, Any]:
         """Fix print statements in a single file."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            lines = content.split("\n")
-            modified = False
-            file_fixes = []
-
-            # Add logging import if needed
-            if self.needs_logging_import(content):
-                lines = self.add_logging_import(lines)
-                modified = True
-                file_fixes.append({"type": "import_added", "description": "Added logging import"})
-
-            # Convert print statements
-            for i, line in enumerate(lines):
-                if self.should_skip_line(line):
-                    continue
-
-                if "print(" in line or "print " in line or "console.print(" in line:
-                    original_line = line
-                    new_line = self.convert_print_to_logging(line)
-
-                    if new_line != original_line:
-                        lines[i] = new_line
-                        modified = True
-                        file_fixes.append(
-                            {
-                                "type": "print_converted",
-                                "line_num": i + 1,
-                                "old": original_line.strip(),
-                                "new": new_line.strip(),
-                            }
-                        )
+            content = read_source_if_contains(file_path, self.triggers)
+            if content is None:
+                return {"success": True, "fixes_applied": 0, "details": []}
+
+            content, file_fixes = self.fix_content(content)
 
             # Write back if modified
-            if modified:
-                content = "\n".join(lines)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            if file_fixes:
+                atomic_write(file_path, content)
 
                 return {"success": True, "fixes_applied": len(file_fixes), "details": file_fixes}
             else:
@@ -123,16 +228,23 @@ class PrintToLoggingFixer:
         """Fix print statements in all Python files."""
         logger.info("Converting print statements to logging...")
 
+        # Unwanted directories are pruned by the walk
+        py_files = list(iter_py_files(self.target_dir))
+
+        # Files are independent, so fix them in parallel and reduce the results here;
+        # files unchanged since a run that found them clean are skipped
+        cache = CleanFileCache(self.target_dir)
+        results = cache.fix_files(self, py_files)
+        cache.save()
+        return self.record_results(py_files, results)
+
+    def record_results(self, py_files: list[Path], results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Reduce per-file fix_file results into directory totals and fixes_applied."""
         files_processed = 0
         total_fixes = 0
         file_results = {}
 
-        for py_file in self.target_dir.rglob("*.py"):
-            # Skip unwanted directories
-            if any(skip in str(py_file) for skip in ["__pycache__", ".venv", ".git", "backup_"]):
-                continue
-
-            result = self.fix_file(py_file)
+        for py_file, result in zip(py_files, results, strict=True):
             file_results[str(py_file)] = result
 
             if result["success"]:
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the fixer orchestrator's backups.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from fixer_orchestrator import FixerOrchestrator
+
+
+class TestCreateBackup(unittest.TestCase):
+    """Test where create_backup records the backup."""
+
+    def setUp(self):
+        self.temp_path = Path(tempfile.mkdtemp())
+        self.target_dir = self.temp_path / "codex"
+        self.target_dir.mkdir()
+        (self.target_dir / "a.py").write_text("x = 1\n")
+
+    def test_copy_backup_is_a_directory(self):
+        """Outside a git work tree the tree is copied and backup_dir is the copy."""
+        orchestrator = FixerOrchestrator(self.target_dir)
+
+        backup = orchestrator.create_backup()
+
+        self.assertEqual(backup, orchestrator.backup_dir)
+        self.assertIsNone(orchestrator.backup_ref)
+        self.assertEqual((backup / "a.py").read_text(), "x = 1\n")
+        self.assertEqual(orchestrator.get_overall_summary()["backup_location"], str(backup))
+
+    @unittest.skipIf(shutil.which("git") is None, "git is not installed")
+    def test_git_backup_is_a_ref(self):
+        """Inside a clean git work tree the backup is a ref and backup_dir stays None."""
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", "-C", str(self.temp_path), *args], capture_output=True, text=True, check=True
+            ).stdout.strip()
+
+        git("init", "-q")
+        git("add", ".")
+        git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-qm", "init")
+        orchestrator = FixerOrchestrator(self.target_dir)
+
+        backup = orchestrator.create_backup()
+
+        self.assertIsNone(backup)
+        self.assertIsNone(orchestrator.backup_dir)
+        self.assertTrue(orchestrator.backup_ref.startswith("refs/codex-backups/"))
+        self.assertEqual(git("rev-parse", orchestrator.backup_ref), git("rev-parse", "HEAD"))
+        self.assertEqual(orchestrator.get_overall_summary()["backup_location"], orchestrator.backup_ref)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared fixer utilities.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+import fixer_utils
+from fixer_utils import CleanFileCache, atomic_write
+from fused_pattern_fixer import FusedPatternFixer
+from hardcoded_paths_fixer import HardcodedPathsFixer
+from print_to_logging_fixer import PrintToLoggingFixer
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Test atomic_write."""
+
+    def setUp(self):
+        self.temp_path = Path(tempfile.mkdtemp())
+
+    def test_replaces_content_and_keeps_mode(self):
+        """The new content lands in the file with its permissions unchanged."""
+        target = self.temp_path / "a.py"
+        target.write_text("old\n")
+        target.chmod(0o640)
+
+        atomic_write(target, "new\n")
+
+        self.assertEqual(target.read_text(), "new\n")
+        self.assertEqual(target.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(sorted(os.listdir(self.temp_path)), ["a.py"])
+
+    def test_writes_through_symlink(self):
+        """A symlinked file is fixed at its target and the link stays a link."""
+        real = self.temp_path / "real"
+        real.mkdir()
+        (real / "a.py").write_text("old\n")
+        tree = self.temp_path / "t"
+        tree.mkdir()
+        link = tree / "a.py"
+        link.symlink_to(Path("..") / "real" / "a.py")
+
+        atomic_write(link, "new\n")
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual((real / "a.py").read_text(), "new\n")
+
+    def test_keeps_hard_links(self):
+        """A file with several hard links is rewritten for all of its names."""
+        target = self.temp_path / "a.py"
+        target.write_text("old\n")
+        other = self.temp_path / "b.py"
+        os.link(target, other)
+
+        atomic_write(target, "new\n")
+
+        self.assertEqual(other.read_text(), "new\n")
+        self.assertTrue(os.path.samefile(target, other))
+
+    def test_leaves_existing_tmp_file_alone(self):
+        """A file that happens to be named like a temp file is not touched."""
+        target = self.temp_path / "a.py"
+        target.write_text("old\n")
+        bystander = self.temp_path / "a.py.tmp"
+        bystander.write_text("keep\n")
+
+        atomic_write(target, "new\n")
+
+        self.assertEqual(bystander.read_text(), "keep\n")
+
+
+class TestCleanFileCache(unittest.TestCase):
+    """Test which files CleanFileCache hands to the fixers."""
+
+    def setUp(self):
+        self.temp_path = Path(tempfile.mkdtemp())
+        self.target_dir = self.temp_path / "codex"
+        self.target_dir.mkdir()
+
+        env = patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.temp_path / "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+
+        # Record the files each run actually fixes, running them in this process
+        self.fixed_files = []
+
+        def fix_files(fixer, files):
+            files = list(files)
+            self.fixed_files.append(sorted(file_path.name for file_path in files))
+            return [fixer.fix_file(file_path) for file_path in files]
+
+        fix_files_patch = patch.object(fixer_utils, "fix_files", fix_files)
+        fix_files_patch.start()
+        self.addCleanup(fix_files_patch.stop)
+
+    def run_fixer(self, fixer) -> list:
+        cache = CleanFileCache(self.target_dir)
+        results = cache.fix_files(fixer, sorted(self.target_dir.glob("*.py")))
+        cache.save()
+        return results
+
+    def test_clean_files_skipped_on_next_run(self):
+        """Files a fixer found clean are not looked at again while unchanged."""
+        (self.target_dir / "a.py").write_text("x = 1\n")
+        (self.target_dir / "b.py").write_text("y = 2\n")
+        fixer = HardcodedPathsFixer(self.target_dir)
+
+        self.run_fixer(fixer)
+        results = self.run_fixer(fixer)
+
+        self.assertEqual(self.fixed_files, [["a.py", "b.py"], []])
+        self.assertEqual(results, [{"success": True, "fixes_applied": 0, "details": []}] * 2)
+
+    def test_changed_file_rechecked(self):
+        """Changing a file drops it from the cache."""
+        (self.target_dir / "a.py").write_text("x = 1\n")
+        fixer = HardcodedPathsFixer(self.target_dir)
+
+        self.run_fixer(fixer)
+        (self.target_dir / "a.py").write_text("x = 'patterns.db'\n")
+        results = self.run_fixer(fixer)
+
+        self.assertEqual(self.fixed_files, [["a.py"], ["a.py"]])
+        self.assertGreater(results[0]["fixes_applied"], 0)
+
+    def test_fixed_file_rechecked_once(self):
+        """A file is stamped before fixing, so one that was rewritten is checked again."""
+        (self.target_dir / "a.py").write_text("import os\nx = 'patterns.db'\n")
+        fixer = HardcodedPathsFixer(self.target_dir)
+
+        self.run_fixer(fixer)
+        self.run_fixer(fixer)
+        self.run_fixer(fixer)
+
+        self.assertEqual(self.fixed_files, [["a.py"], ["a.py"], []])
+
+    def test_fused_run_needs_every_fixer_clean(self):
+        """A fused run skips a file only if every one of its fixers found it clean."""
+        (self.target_dir / "a.py").write_text("print(x)\n")
+        paths_fixer = HardcodedPathsFixer(self.target_dir)
+        print_fixer = PrintToLoggingFixer(self.target_dir)
+
+        self.run_fixer(paths_fixer)
+        results = self.run_fixer(FusedPatternFixer([paths_fixer, print_fixer]))
+
+        self.assertEqual(self.fixed_files, [["a.py"], ["a.py"]])
+        self.assertEqual(results[0][0]["fixes_applied"], 0)
+        self.assertGreater(results[0][1]["fixes_applied"], 0)
+
+    def test_changed_fixer_rechecks_files(self):
+        """Files are checked again once the fixer's code changes."""
+        (self.target_dir / "a.py").write_text("x = 1\n")
+        fixer = HardcodedPathsFixer(self.target_dir)
+
+        self.run_fixer(fixer)
+        with patch.object(fixer_utils, "_fixer_digest", return_value="changed"):
+            self.run_fixer(fixer)
+
+        self.assertEqual(self.fixed_files, [["a.py"], ["a.py"]])
+
+    def test_cache_kept_outside_target_dir(self):
+        """Nothing but the fixed files is written into the target directory."""
+        (self.target_dir / "a.py").write_text("x = 1\n")
+
+        self.run_fixer(HardcodedPathsFixer(self.target_dir))
+
+        self.assertEqual(os.listdir(self.target_dir), ["a.py"])
+        self.assertTrue(any((self.temp_path / "cache" / "codex").rglob("*.json")))
+
+
+class TestFusedPatternFixer(unittest.TestCase):
+    """Test the results FusedPatternFixer reports."""
+
+    def test_results_not_shared(self):
+        """Every fixer gets its own result, so updating one leaves the others alone."""
+        temp_path = Path(tempfile.mkdtemp())
+        target = temp_path / "a.py"
+        target.write_text("x = 1\n")
+        fixers = [HardcodedPathsFixer(temp_path), PrintToLoggingFixer(temp_path)]
+
+        for file_path in (target, temp_path / "missing.py"):
+            with self.subTest(file=file_path.name):
+                results = FusedPatternFixer(fixers).fix_file(file_path)
+                results[0]["fixes_applied"] = 1
+                self.assertEqual(results[1]["fixes_applied"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
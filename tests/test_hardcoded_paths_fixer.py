@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the hardcoded paths fixer.
+
+The settings import it adds must leave the file valid Python.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from hardcoded_paths_fixer import HardcodedPathsFixer
+
+
+class TestHardcodedPathsFixer(unittest.TestCase):
+    """Test where fix_content adds the settings import."""
+
+    def setUp(self):
+        self.fixer = HardcodedPathsFixer(Path(tempfile.mkdtemp()))
+
+    def fix(self, source: str) -> str:
+        content, _ = self.fixer.fix_content(source)
+        return content
+
+    def test_import_after_imports(self):
+        """The settings import goes after the last import."""
+        content = self.fix('import os\nimport re\n\nDB = "patterns.db"\n')
+        self.assertEqual(
+            content, "import os\nimport re\nfrom .settings import settings\n\nDB = settings.database_path\n"
+        )
+
+    def test_import_after_multi_line_import(self):
+        """The settings import goes after a parenthesized import, not inside it."""
+        content = self.fix('from x import (\n    a,\n    b,\n)\n\nDB = "patterns.db"\n')
+        self.assertEqual(
+            content,
+            "from x import (\n    a,\n    b,\n)\nfrom .settings import settings\n\nDB = settings.database_path\n",
+        )
+
+    def test_import_after_docstring(self):
+        """Without imports, the settings import goes after a multi-line module docstring."""
+        content = self.fix('"""Doc.\n\nfrom here on.\n"""\nDB = "patterns.db"\n')
+        self.assertEqual(
+            content, '"""Doc.\n\nfrom here on.\n"""\nfrom .settings import settings\nDB = settings.database_path\n'
+        )
+
+    def test_existing_import_kept(self):
+        """No second settings import is added."""
+        source = 'from .settings import settings\nDB = "patterns.db"\n'
+        self.assertEqual(self.fix(source), "from .settings import settings\nDB = settings.database_path\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the print to logging fixer.
+
+Only print calls that logging.info can take verbatim may be converted.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "fixers"))
+
+from print_to_logging_fixer import PrintToLoggingFixer
+
+
+class TestPrintToLoggingFixer(unittest.TestCase):
+    """Test which print calls fix_content converts."""
+
+    def setUp(self):
+        self.fixer = PrintToLoggingFixer(Path(tempfile.mkdtemp()))
+
+    def fix(self, source: str) -> str:
+        content, _ = self.fixer.fix_content(source)
+        return content
+
+    def test_single_argument_converted(self):
+        """A print with one positional argument becomes logging.info."""
+        content = self.fix('import os\n\nprint("hello")\n')
+        self.assertEqual(content, 'import os\nimport logging\n\nlogging.info("hello")\n')
+
+    def test_console_print_converted(self):
+        """console.print with one positional argument becomes logging.info."""
+        content = self.fix("import logging\nconsole.print(message)\n")
+        self.assertEqual(content, "import logging\nlogging.info(message)\n")
+
+    def test_keyword_arguments_left_alone(self):
+        """file=, end=, sep= and flush= have no logging counterpart."""
+        for call in (
+            "print(x, file=sys.stderr)",
+            'print(x, end="")',
+            'print(x, sep=", ")',
+            "print(x, flush=True)",
+            'console.print(x, style="bold")',
+        ):
+            with self.subTest(call=call):
+                source = f"import sys\n{call}\n"
+                self.assertEqual(self.fix(source), source)
+
+    def test_several_arguments_left_alone(self):
+        """Several arguments would turn into a broken %-format call."""
+        source = 'print("a", b)\n'
+        self.assertEqual(self.fix(source), source)
+
+    def test_no_or_starred_arguments_left_alone(self):
+        """print() and print(*args) cannot be passed to logging.info as they are."""
+        for call in ("print()", "print(*lines)"):
+            with self.subTest(call=call):
+                source = f"{call}\n"
+                self.assertEqual(self.fix(source), source)
+
+    def test_only_convertible_calls_on_a_line(self):
+        """Calls on the same line are judged one by one."""
+        content = self.fix("import logging\nprint(a); print(b, end='')\n")
+        self.assertEqual(content, "import logging\nlogging.info(a); print(b, end='')\n")
+
+    def test_non_ascii_line(self):
+        """Columns stay right on lines with multi-byte characters."""
+        content = self.fix('import logging\nx = "é"; print(x)\n')
+        self.assertEqual(content, 'import logging\nx = "é"; logging.info(x)\n')
+
+    def test_strings_and_methods_left_alone(self):
+        """print inside strings, comments and other objects' methods is not a print call."""
+        source = 'import logging\ns = "print(x)"  # print(y)\nprinter.print(z)\n'
+        self.assertEqual(self.fix(source), source)
+
+    def test_import_after_multi_line_import(self):
+        """The logging import goes after a parenthesized import, not inside it."""
+        content = self.fix('from x import (\n    a,\n)\nprint("hi")\n')
+        self.assertEqual(content, 'from x import (\n    a,\n)\nimport logging\nlogging.info("hi")\n')
+
+    def test_import_after_docstring(self):
+        """Without imports, the logging import goes after a multi-line module docstring."""
+        content = self.fix('"""Doc.\n\nprint(x) here is prose.\n"""\nprint(x)\n')
+        self.assertEqual(content, '"""Doc.\n\nprint(x) here is prose.\n"""\nimport logging\nlogging.info(x)\n')
+
+    def test_import_after_statements_sharing_a_line(self):
+        """A statement after the last import on the same line is passed as a whole."""
+        content = self.fix("import os; x = (\n    1)\nprint(x)\n")
+        self.assertEqual(content, "import os; x = (\n    1)\nimport logging\nlogging.info(x)\n")
+
+    def test_import_before_first_statement(self):
+        """Without imports or docstring, the logging import goes before the first statement."""
+        content = self.fix("#!/usr/bin/env python3\n@decorate\ndef f():\n    print(x)\n")
+        self.assertEqual(content, "#!/usr/bin/env python3\nimport logging\n@decorate\ndef f():\n    logging.info(x)\n")
+
+    def test_converted_line_numbers(self):
+        """Reported line numbers are those of the fixed content."""
+        _, fixes = self.fixer.fix_content("import os\nprint(a)\n")
+        self.assertEqual([fix.get("line_num") for fix in fixes], [None, 3])
+
+    def test_no_import_without_conversion(self):
+        """The logging import is only added when a call is converted."""
+        content, fixes = self.fixer.fix_content("print(x, file=f)\n")
+        self.assertEqual(content, "print(x, file=f)\n")
+        self.assertEqual(fixes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()